@@ -20,17 +20,21 @@ Gestures (5 types — EASY to perform):
 from __future__ import annotations
 
 import asyncio
+import base64
 import math
+import queue
 import sys
+import threading
 import time
 import urllib.request
 import uuid
 from collections import deque
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
-import orjson
+import numpy as np
 import websockets
 
 # ─── Windows fix for MediaPipe 0.10.x Tasks API ─────────────────────────────
@@ -48,6 +52,12 @@ if sys.platform == "win32":
 
 import mediapipe as mp
 
+try:
+    from numba import njit as _njit
+except ImportError:  # numba is optional — kernels run as plain Python
+    def _njit(*_args, **_kwargs):
+        return lambda fn: fn
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  CONFIGURATION
 # ═════════════════════════════════════════════════════════════════════════════
@@ -55,9 +65,9 @@ WS_URL         = "ws://localhost:8000/ws/gestures"
 CAMERA_INDEX   = 0
 CAM_WIDTH      = 640
 CAM_HEIGHT     = 480
-TARGET_FPS     = 30
-FRAME_INTERVAL = 1.0 / TARGET_FPS
+TARGET_FPS     = 30       # requested from the driver; capture paces the pipeline
 RECONNECT_DELAY = 2.0
+SEND_QUEUE_MAX  = 64      # outgoing payloads buffered while the socket is busy/reconnecting
 
 # ── Pinch thresholds (normalised coords, 0-1) ───────────────────────────
 PINCH_DIST     = 0.04     # Below this → pinched ON.  Above → OFF.
@@ -70,10 +80,19 @@ HOLD_MIN_MS    = 500      # ms — pinch longer than this, no movement → hold
 # ── Movement / velocity ─────────────────────────────────────────────────
 DRAG_DEADZONE  = 0.05     # cumulative movement must exceed 5% to count as Drag
 FLICK_VELOCITY = 0.30     # distance travelled in last 0.1s must exceed this → Flick
+TRAIL_LEN      = 12       # index-tip samples kept for the velocity estimate
 
 # ── Ghost prevention ────────────────────────────────────────────────────
 DOUBLE_TAP_COOL = 0.30    # seconds — after double_tap, ignore index for 0.3s
 
+# ── Adaptive detection rate ─────────────────────────────────────────────
+STATIC_DELTA   = 0.003    # max landmark change (L∞) between results counted as static
+STATIC_FRAMES  = 5        # consecutive static results before detecting every other frame
+
+# ── Send suppression ────────────────────────────────────────────────────
+SEND_EPSILON   = 0.002    # max landmark change (L∞, normalised) treated as "still"
+HEARTBEAT_SECS = 1.0      # always send at least this often so consumers see liveness
+
 # ── Model ────────────────────────────────────────────────────────────────
 MODEL_URL = (
     "https://storage.googleapis.com/mediapipe-models/"
@@ -92,6 +111,13 @@ VisionRunningMode  = mp.tasks.vision.RunningMode
 THUMB_TIP  = 4
 INDEX_TIP  = 8
 MIDDLE_TIP = 12
+NUM_LANDMARKS = 21
+
+# Wire format for landmarks: signed Q1.14 fixed point (value × 16384 → int16).
+# Covers [-2, 2) — x/y may stray just outside 0-1 and z is signed depth —
+# at ~6e-5 resolution, i.e. well under a pixel even on a 4K screen.
+LM_Q_SCALE = 16384.0
+PALM_IDS   = [0, 5, 9, 13, 17]
 
 HAND_CONNS = [
     (0,1),(1,2),(2,3),(3,4),
@@ -102,6 +128,20 @@ HAND_CONNS = [
     (5,9),(9,13),(13,17),
 ]
 
+# HAND_CONNS regrouped into open polyline strips (one cv2.polylines call)
+HAND_STRIPS = [
+    np.array(s, dtype=np.intp) for s in (
+        [0, 1, 2, 3, 4],
+        [0, 5, 6, 7, 8],
+        [0, 9, 10, 11, 12],
+        [0, 13, 14, 15, 16],
+        [0, 17, 18, 19, 20],
+        [5, 9, 13, 17],
+    )
+]
+_HIGHLIGHT = (THUMB_TIP, INDEX_TIP, MIDDLE_TIP)
+_PLAIN_IDS = [i for i in range(NUM_LANDMARKS) if i not in _HIGHLIGHT]
+
 GCOLORS = {
     "tap":         (0, 255, 255),   # yellow
     "double_tap":  (0, 165, 255),   # orange
@@ -115,6 +155,7 @@ GCOLORS = {
 TAP_MARKER_LIFETIME  = 2.0    # seconds to show tap markers
 DRAG_TRAIL_LIFETIME  = 2.0    # seconds to show drag trail after release
 MARKER_RADIUS        = 12     # crosshair marker size in pixels
+MAX_TAP_MARKERS      = 64     # ring capacity — oldest marker is overwritten
 
 
 def ensure_model() -> str:
@@ -128,16 +169,88 @@ def ensure_model() -> str:
     return str(MODEL_PATH)
 
 
-def _dist(a, b) -> float:
-    return math.sqrt((a.x - b.x)**2 + (a.y - b.y)**2)
+def lm_to_np(lm, out: np.ndarray) -> np.ndarray:
+    """
+    Copy MediaPipe landmarks into a (21, 3) float32 buffer.
 
+    Tasks-API landmarks are plain Python dataclasses (not protobufs), so
+    there is no contiguous memory to view — the cheapest route is one
+    tuple per landmark handed to NumPy in a single bulk assignment.
+    """
+    out[:] = [(l.x, l.y, l.z) for l in lm]
+    return out
 
-def _palm(lm):
-    ids = [0, 5, 9, 13, 17]
-    return (
-        sum(lm[i].x for i in ids) / 5,
-        sum(lm[i].y for i in ids) / 5,
-    )
+
+@_njit(cache=True, fastmath=True)
+def _pinch_step(buf, idx_pinched, mid_pinched):
+    """
+    Pinch distances + hysteresis from a (21, 3) landmark buffer.
+    Returns (idx_dist, mid_dist, idx_pinched, mid_pinched).
+    """
+    tx = buf[THUMB_TIP, 0]
+    ty = buf[THUMB_TIP, 1]
+    dx = buf[INDEX_TIP, 0] - tx
+    dy = buf[INDEX_TIP, 1] - ty
+    idx_dist = math.sqrt(dx * dx + dy * dy)
+    dx = buf[MIDDLE_TIP, 0] - tx
+    dy = buf[MIDDLE_TIP, 1] - ty
+    mid_dist = math.sqrt(dx * dx + dy * dy)
+
+    if not idx_pinched and idx_dist < PINCH_DIST:
+        idx_pinched = True
+    elif idx_pinched and idx_dist > PINCH_EXIT:
+        idx_pinched = False
+
+    if not mid_pinched and mid_dist < PINCH_DIST:
+        mid_pinched = True
+    elif mid_pinched and mid_dist > PINCH_EXIT:
+        mid_pinched = False
+
+    return idx_dist, mid_dist, idx_pinched, mid_pinched
+
+
+def _palm(buf: np.ndarray) -> tuple[float, float]:
+    px, py = buf[PALM_IDS, :2].mean(axis=0).tolist()
+    return px, py
+
+
+def mirror_rgb(frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Mirror a BGR frame horizontally and convert it to RGB in a single pass,
+    writing into the preallocated `out` buffer.
+
+    Reversing the packed bytes of each row reverses the pixel order *and*
+    the channel order at once, so one cv2.flip over the (h, w*3) view
+    replaces the flip → cvtColor chain for the MediaPipe input.
+    """
+    h = frame.shape[0]
+    cv2.flip(frame.reshape(h, -1), 1, dst=out.reshape(h, -1))
+    return out
+
+
+# ── Event envelope ───────────────────────────────────────────────────────
+# The payload shape never changes, so it is a single %-template: constant
+# keys/literals are baked in and each frame only formats the numbers —
+# no nested dicts, no generic serializer walk.  Floats use fixed decimals
+# (same precision the old round() calls kept); gesture type/state are
+# internal identifiers and the landmark blob is base64, so nothing needs
+# JSON escaping.
+#
+#   tracking_data.landmarks_q14 — (21, 3) x/y/z as int16 Q1.14, base64;
+#   decode with np.frombuffer(b64decode(s), np.int16).reshape(21, 3) / 16384
+PAYLOAD_TEMPLATE = (
+    '{"event_id":"evt_%s_%d","timestamp":%d,"success":true,'
+    '"gesture":{"type":"%s","state":"%s","confidence":%.5f,'
+    '"handedness":"Right","target_element_id":null,'
+    '"tracking_data":{"landmarks_q14":"%s",'
+    '"world_coordinates":{"x":%.5f,"y":%.5f,"z":%.5f}},'
+    '"interaction_data":{'
+    '"pinch_status":{"is_pinched":%s,"pinch_strength":%.4f,"pinch_distance":%.5f},'
+    '"movement":{"origin":{"x":%.5f,"y":%.5f},"current":{"x":%.5f,"y":%.5f},'
+    '"delta":{"dx":%.5f,"dy":%.5f},"velocity":{"vx":%.2f,"vy":%.2f}},'
+    '"timing":{"duration_ms":%.1f,"tap_count":%d}}},'
+    '"cursor":{"x":%.5f,"y":%.5f}}'
+)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -149,50 +262,85 @@ def _palm(lm):
 class TestOverlay:
     """Tracks tap markers and drag trails for visual testing."""
 
+    TAP_STYLES = (
+        ((0, 255, 255), "TAP"),   # 0 = tap         (cyan/yellow)
+        ((0, 165, 255), "DBL"),   # 1 = double_tap  (orange)
+    )
+
     def __init__(self):
-        # Tap markers: list of (x_norm, y_norm, timestamp, gesture_type)
-        self.tap_markers: list[tuple[float, float, float, str]] = []
-        # Drag trail: list of (x_norm, y_norm) points during active drag
-        self.drag_points: list[tuple[float, float]] = []
-        # Finished drag trails: list of (points_list, end_timestamp)
-        self.finished_trails: list[tuple[list[tuple[float, float]], float]] = []
+        # Tap markers as parallel ring arrays: xy (normalised), time, style.
+        # Unused / expired slots have t = -inf.
+        self._tap_xy   = np.zeros((MAX_TAP_MARKERS, 2), dtype=np.float32)
+        self._tap_t    = np.full(MAX_TAP_MARKERS, -np.inf, dtype=np.float64)
+        self._tap_kind = np.zeros(MAX_TAP_MARKERS, dtype=np.uint8)
+        self._tap_i    = 0
+        # Active drag trail: growable (N, 2) array of normalised points
+        self._drag = np.empty((256, 2), dtype=np.float32)
+        self._drag_n = 0
+        # Finished drag trails: list of (points (N, 2), end_timestamp)
+        self.finished_trails: list[tuple[np.ndarray, float]] = []
         self.dragging = False
+        # Written by the engine (asyncio loop), drawn by the display thread
+        self._lock = threading.Lock()
 
     def on_tap(self, x: float, y: float, gesture_type: str = "tap"):
         """Record a tap/double_tap at normalised (x, y)."""
-        self.tap_markers.append((x, y, time.monotonic(), gesture_type))
+        with self._lock:
+            i = self._tap_i % MAX_TAP_MARKERS
+            self._tap_xy[i] = (x, y)
+            self._tap_t[i] = time.monotonic()
+            self._tap_kind[i] = gesture_type == "double_tap"
+            self._tap_i += 1
+
+    @property
+    def drag_points(self) -> np.ndarray:
+        """View of the active drag trail points."""
+        return self._drag[:self._drag_n]
 
     def on_drag_start(self, x: float, y: float):
         """Start a new drag trail."""
-        self.drag_points = [(x, y)]
-        self.dragging = True
+        with self._lock:
+            self._drag_n = 0
+            self.dragging = True
+            self._append_drag(x, y)
 
     def on_drag_update(self, x: float, y: float):
         """Add a point to the current drag trail."""
-        if self.dragging:
-            self.drag_points.append((x, y))
+        with self._lock:
+            if self.dragging:
+                self._append_drag(x, y)
 
     def on_drag_end(self):
         """Finish the current drag trail (it will persist for DRAG_TRAIL_LIFETIME)."""
-        if self.drag_points:
-            self.finished_trails.append((list(self.drag_points), time.monotonic()))
-        self.drag_points = []
-        self.dragging = False
+        with self._lock:
+            if self._drag_n:
+                self.finished_trails.append((self.drag_points.copy(), time.monotonic()))
+            self._drag_n = 0
+            self.dragging = False
+
+    def _append_drag(self, x: float, y: float):
+        if self._drag_n == len(self._drag):
+            grown = np.empty((2 * len(self._drag), 2), dtype=np.float32)
+            grown[:self._drag_n] = self._drag
+            self._drag = grown
+        self._drag[self._drag_n] = (x, y)
+        self._drag_n += 1
 
     def draw(self, frame, fw: int, fh: int):
         """Draw all active markers and trails onto the frame."""
+        with self._lock:
+            self._draw_locked(frame, fw, fh)
+
+    def _draw_locked(self, frame, fw: int, fh: int):
         now = time.monotonic()
 
-        # ── Expired cleanup ──────────────────────────────────────────
-        self.tap_markers = [
-            m for m in self.tap_markers if now - m[2] < TAP_MARKER_LIFETIME
-        ]
-        self.finished_trails = [
-            t for t in self.finished_trails if now - t[1] < DRAG_TRAIL_LIFETIME
-        ]
+        # ── Expired cleanup (trails are appended in time order) ──────
+        trails = self.finished_trails
+        while trails and now - trails[0][1] >= DRAG_TRAIL_LIFETIME:
+            trails.pop(0)
 
         # ── Draw finished drag trails (fading) ───────────────────────
-        for trail_pts, end_t in self.finished_trails:
+        for trail_pts, end_t in trails:
             age = now - end_t
             alpha = max(0.0, 1.0 - age / DRAG_TRAIL_LIFETIME)
             self._draw_trail(frame, trail_pts, fw, fh, alpha)
@@ -202,24 +350,23 @@ class TestOverlay:
             self._draw_trail(frame, self.drag_points, fw, fh, 1.0)
 
         # ── Draw tap markers ─────────────────────────────────────────
-        for mx, my, t, gtype in self.tap_markers:
-            age = now - t
-            alpha = max(0.0, 1.0 - age / TAP_MARKER_LIFETIME)
-            px = int(mx * fw)
-            py = int(my * fh)
-
-            if gtype == "double_tap":
-                col = (0, 165, 255)  # orange
-                label = "DBL"
-            else:
-                col = (0, 255, 255)  # cyan/yellow
-                label = "TAP"
+        age = now - self._tap_t
+        live = np.flatnonzero(age < TAP_MARKER_LIFETIME)
+        if not live.size:
+            return
+        alphas = (1.0 - age[live] / TAP_MARKER_LIFETIME).tolist()
+        xy = self._tap_xy[live]
+        pxy = (xy * (fw, fh)).astype(np.int32).tolist()
+        r = MARKER_RADIUS
+
+        for (mx, my), (px, py), kind, alpha in zip(
+                xy.tolist(), pxy, self._tap_kind[live].tolist(), alphas):
+            col, label = self.TAP_STYLES[kind]
 
             # Fade by adjusting colour intensity
             c = tuple(int(v * alpha) for v in col)
 
             # Crosshair
-            r = MARKER_RADIUS
             cv2.line(frame, (px - r, py), (px + r, py), c, 2, cv2.LINE_AA)
             cv2.line(frame, (px, py - r), (px, py + r), c, 2, cv2.LINE_AA)
             cv2.circle(frame, (px, py), r, c, 1, cv2.LINE_AA)
@@ -233,32 +380,28 @@ class TestOverlay:
         """Draw a polyline trail with thickness and glow."""
         if len(pts) < 2:
             return
-        pixel_pts = [(int(x * fw), int(y * fh)) for x, y in pts]
+        pixel_pts = (pts * (fw, fh)).astype(np.int32)
+        start = tuple(pixel_pts[0].tolist())
+        ep = tuple(pixel_pts[-1].tolist())
 
         # Main line (green, fading)
         col = tuple(int(v * alpha) for v in (0, 255, 0))
-        for i in range(len(pixel_pts) - 1):
-            cv2.line(frame, pixel_pts[i], pixel_pts[i + 1], col, 3, cv2.LINE_AA)
+        cv2.polylines(frame, [pixel_pts], False, col, 3, cv2.LINE_AA)
 
         # Start dot (blue)
         sc = tuple(int(v * alpha) for v in (255, 200, 0))
-        cv2.circle(frame, pixel_pts[0], 6, sc, -1, cv2.LINE_AA)
+        cv2.circle(frame, start, 6, sc, -1, cv2.LINE_AA)
 
         # End dot (red)
         ec = tuple(int(v * alpha) for v in (0, 0, 255))
-        cv2.circle(frame, pixel_pts[-1], 6, ec, -1, cv2.LINE_AA)
+        cv2.circle(frame, ep, 6, ec, -1, cv2.LINE_AA)
 
         # Distance label at end
-        if len(pts) >= 2:
-            total_dist = sum(
-                math.sqrt((pts[i+1][0] - pts[i][0])**2 + (pts[i+1][1] - pts[i][1])**2)
-                for i in range(len(pts) - 1)
-            )
-            dist_text = f"{total_dist:.3f}"
-            ep = pixel_pts[-1]
-            tc = tuple(int(v * alpha) for v in (0, 255, 0))
-            cv2.putText(frame, dist_text, (ep[0] + 8, ep[1] - 8),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.45, tc, 1, cv2.LINE_AA)
+        total_dist = float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum())
+        dist_text = f"{total_dist:.3f}"
+        tc = tuple(int(v * alpha) for v in (0, 255, 0))
+        cv2.putText(frame, dist_text, (ep[0] + 8, ep[1] - 8),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, tc, 1, cv2.LINE_AA)
 
 
 class GestureEngine:
@@ -302,7 +445,10 @@ class GestureEngine:
         self.moved     = False
 
         # Velocity
-        self._trail: deque[tuple[float, float, float]] = deque(maxlen=12)
+        # Ring buffer of (x, y, t) rows; float64 so monotonic time keeps
+        # sub-ms resolution.  _trail_n counts total pushes since last clear.
+        self._trail = np.zeros((TRAIL_LEN, 3), dtype=np.float64)
+        self._trail_n = 0
         self.vel = 0.0
 
         # Output
@@ -324,36 +470,37 @@ class GestureEngine:
         # Test overlay
         self.overlay = TestOverlay()
 
-    def update(self, lm: list) -> dict:
+        # Landmarks as a reusable (21, 3) float32 buffer — filled once per frame
+        self._lm_buf = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+
+        # Event ids: random per-connection prefix + counter (no uuid per frame)
+        self._session_id = ""
+        self._seq = 0
+        self.new_session()
+
+        # Last state actually sent (for skipping unchanged frames)
+        self._sent_lm   = np.full((NUM_LANDMARKS, 3), np.inf, dtype=np.float32)
+        self._sent_sig  = None
+        self._sent_time = 0.0
+
+    def update(self, lm) -> bytes | None:
+        """Advance the state machine; returns the encoded event, or None when unchanged."""
         now = time.monotonic()
 
-        thumb  = lm[THUMB_TIP]
-        index  = lm[INDEX_TIP]
-        middle = lm[MIDDLE_TIP]
+        buf = lm_to_np(lm, self._lm_buf)
 
         # ── Cursor always follows index finger tip ───────────────────
-        ix, iy = index.x, index.y
+        ix, iy = buf[INDEX_TIP, :2].tolist()
         self.cursor_x = ix
         self.cursor_y = iy
 
-        # ── Raw distances ────────────────────────────────────────────
-        self.idx_dist = _dist(thumb, index)
-        self.mid_dist = _dist(thumb, middle)
-
-        # ── Hysteresis for index pinch ───────────────────────────────
-        if not self.idx_pinched and self.idx_dist < PINCH_DIST:
-            self.idx_pinched = True
-        elif self.idx_pinched and self.idx_dist > PINCH_EXIT:
-            self.idx_pinched = False
-
-        # ── Hysteresis for middle pinch ──────────────────────────────
-        if not self.mid_pinched and self.mid_dist < PINCH_DIST:
-            self.mid_pinched = True
-        elif self.mid_pinched and self.mid_dist > PINCH_EXIT:
-            self.mid_pinched = False
+        # ── Raw distances + pinch hysteresis (JIT kernel) ────────────
+        (self.idx_dist, self.mid_dist,
+         self.idx_pinched, self.mid_pinched) = _pinch_step(
+            buf, self.idx_pinched, self.mid_pinched)
 
         # ── Velocity trail (index finger tip) ────────────────────────
-        self._trail.append((ix, iy, now))
+        self._push_trail(ix, iy, now)
 
         # ── Reset per-frame ──────────────────────────────────────────
         self.frame_dx = 0.0
@@ -389,7 +536,8 @@ class GestureEngine:
                     self._flash("DOUBLE TAP", now)
                     self._log("double_tap")
                     # Record tap marker at middle finger position
-                    self.overlay.on_tap(middle.x, middle.y, "double_tap")
+                    mx, my = buf[MIDDLE_TIP, :2].tolist()
+                    self.overlay.on_tap(mx, my, "double_tap")
                     # Ghost prevention: ignore index for DOUBLE_TAP_COOL
                     self._dbl_cooldown_until = now + DOUBLE_TAP_COOL
                 else:
@@ -444,7 +592,7 @@ class GestureEngine:
                     self._flash("TAP", now)
                     self._log("tap")
                     # Record tap marker at index finger position
-                    self.overlay.on_tap(index.x, index.y, "tap")
+                    self.overlay.on_tap(ix, iy, "tap")
 
                 elif self.moved:
                     self.gtype  = "pinch_drag"
@@ -460,7 +608,9 @@ class GestureEngine:
                 self._reset_pinch()
                 self.state = self.S_IDLE
 
-        return self._payload(lm)
+        if not self._should_send(now):
+            return None
+        return self._encode()
 
     # ── Transitions ──────────────────────────────────────────────────────
     def _enter_idx_pinch(self, now, ix, iy):
@@ -469,8 +619,8 @@ class GestureEngine:
         self.prev_palm = (ix, iy)
         self.cum_move  = 0.0
         self.moved     = False
-        self._trail.clear()
-        self._trail.append((ix, iy, now))
+        self._trail_n = 0
+        self._push_trail(ix, iy, now)
         self.overlay.on_drag_start(ix, iy)  # prepare drag start point
         self.gtype  = "pinch_hold"
         self.gstate = "start"
@@ -486,26 +636,51 @@ class GestureEngine:
         self.cum_move  = 0.0
         self.moved     = False
 
+    def _push_trail(self, x: float, y: float, t: float):
+        row = self._trail[self._trail_n % TRAIL_LEN]
+        row[0] = x
+        row[1] = y
+        row[2] = t
+        self._trail_n += 1
+
     def _calc_vel(self) -> float:
         """Distance travelled in the last ~0.1s window."""
-        if len(self._trail) < 3:
+        n = min(self._trail_n, TRAIL_LEN)
+        if n < 3:
             return 0.0
-        now = self._trail[-1][2]
-        # Find the sample closest to 0.1s ago
-        target_t = now - 0.1
-        best = self._trail[0]
-        for pt in self._trail:
-            if pt[2] <= target_t:
-                best = pt
-            else:
-                break
-        x0, y0, t0 = best
-        x1, y1, t1 = self._trail[-1]
+        # Oldest → newest view of the ring
+        start = self._trail_n - n
+        tr = self._trail[(np.arange(start, start + n)) % TRAIL_LEN]
+        x1, y1, t1 = tr[-1].tolist()
+        # Latest sample at or before 0.1s ago (falls back to the oldest)
+        i = max(int(np.searchsorted(tr[:, 2], t1 - 0.1, side="right")) - 1, 0)
+        x0, y0, t0 = tr[i].tolist()
         dt = t1 - t0
         if dt < 0.01:
             return 0.0
         # Return distance over 0.1s (not per-second)
-        return math.sqrt((x1 - x0)**2 + (y1 - y0)**2) * (0.1 / dt)
+        return math.hypot(x1 - x0, y1 - y0) * (0.1 / dt)
+
+    def new_session(self):
+        """Start a fresh event-id namespace (called on every WS (re)connect)."""
+        self._session_id = uuid.uuid4().hex[:12]
+        self._seq = 0
+
+    def _quantized_lm(self) -> bytes:
+        q = np.rint(self._lm_buf * LM_Q_SCALE)
+        np.clip(q, -32768, 32767, out=q)
+        return q.astype(np.int16).tobytes()
+
+    def _should_send(self, now: float) -> bool:
+        """False when neither gesture state nor landmarks moved since the last send."""
+        sig = (self.gtype, self.gstate, self.tap_count)
+        still = float(np.abs(self._lm_buf - self._sent_lm).max()) < SEND_EPSILON
+        if sig == self._sent_sig and still and now - self._sent_time < HEARTBEAT_SECS:
+            return False
+        self._sent_sig = sig
+        np.copyto(self._sent_lm, self._lm_buf)
+        self._sent_time = now
+        return True
 
     def _flash(self, label: str, now: float):
         self._flash_label = label
@@ -516,61 +691,31 @@ class GestureEngine:
               f"mid={self.mid_dist:.4f}  dur={self.dur_ms:.0f}ms  "
               f"vel={self.vel:.3f}  move={self.cum_move:.4f}")
 
-    def _payload(self, lm) -> dict:
-        return {
-            "event_id":  f"evt_{uuid.uuid4().hex[:12]}",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "success":   True,
-            "gesture": {
-                "type":  self.gtype,
-                "state": self.gstate,
-                "confidence": 1.0 - min(self.idx_dist, self.mid_dist),
-                "handedness": "Right",
-                "target_element_id": None,
-                "tracking_data": {
-                    "landmarks": [
-                        {"id": i, "x": round(l.x, 5), "y": round(l.y, 5),
-                         "z": round(l.z, 5)} for i, l in enumerate(lm)
-                    ],
-                    "world_coordinates": {
-                        "x": round(lm[INDEX_TIP].x, 5),
-                        "y": round(lm[INDEX_TIP].y, 5),
-                        "z": round(lm[INDEX_TIP].z, 5),
-                    },
-                },
-                "interaction_data": {
-                    "pinch_status": {
-                        "is_pinched":     self.idx_pinched or self.mid_pinched,
-                        "pinch_strength": round(max(0.0, 1.0 - self.idx_dist / PINCH_EXIT), 4),
-                        "pinch_distance": round(self.idx_dist, 5),
-                    },
-                    "movement": {
-                        "origin":  {"x": round(self.cursor_x, 5),
-                                    "y": round(self.cursor_y, 5)},
-                        "current": {"x": round(self.cursor_x, 5),
-                                    "y": round(self.cursor_y, 5)},
-                        "delta": {
-                            "dx": round(self.frame_dx, 5),
-                            "dy": round(self.frame_dy, 5),
-                        },
-                        "velocity": {
-                            "vx": round(self.frame_dx * 1000, 2),
-                            "vy": round(self.frame_dy * 1000, 2),
-                        },
-                    },
-                    "timing": {
-                        "duration_ms": round(self.dur_ms, 1),
-                        "tap_count":   self.tap_count,
-                    },
-                },
-            },
-            "cursor": {
-                "x": round(self.cursor_x, 5),
-                "y": round(self.cursor_y, 5),
-            },
-        }
+    def _encode(self) -> bytes:
+        """Render the event envelope straight to JSON bytes via PAYLOAD_TEMPLATE."""
+        wx, wy, wz = self._lm_buf[INDEX_TIP].tolist()
+        cx, cy = self.cursor_x, self.cursor_y
+        self._seq += 1
+        return (PAYLOAD_TEMPLATE % (
+            self._session_id, self._seq, time.time_ns(),
+            self.gtype, self.gstate, 1.0 - min(self.idx_dist, self.mid_dist),
+            base64.b64encode(self._quantized_lm()).decode("ascii"),
+            wx, wy, wz,
+            "true" if self.idx_pinched or self.mid_pinched else "false",
+            max(0.0, 1.0 - self.idx_dist / PINCH_EXIT), self.idx_dist,
+            cx, cy, cx, cy,
+            self.frame_dx, self.frame_dy,
+            self.frame_dx * 1000, self.frame_dy * 1000,
+            self.dur_ms, self.tap_count,
+            cx, cy,
+        )).encode("ascii")
 
     # ── HUD properties ───────────────────────────────────────────────────
+    @property
+    def landmarks(self) -> np.ndarray:
+        """(21, 3) float32 landmarks from the latest update()."""
+        return self._lm_buf
+
     @property
     def flash_label(self) -> str:
         if time.monotonic() < self._flash_until:
@@ -586,33 +731,65 @@ class GestureEngine:
         return f"{self.gtype} ({self.gstate})"
 
 
+@dataclass(frozen=True, slots=True)
+class EngineView:
+    """Immutable copy of the engine state the drawing code reads."""
+    gtype:       str
+    gstate:      str
+    idx_pinched: bool
+    mid_pinched: bool
+    idx_dist:    float
+    mid_dist:    float
+    dur_ms:      float
+    vel:         float
+    cursor_x:    float
+    cursor_y:    float
+    flash_label: str
+    landmarks:   np.ndarray | None   # own copy; None when no hand is tracked
+    overlay:     TestOverlay         # shared, internally locked
+
+    @property
+    def pinched(self) -> bool:
+        return self.idx_pinched or self.mid_pinched
+
+    @classmethod
+    def of(cls, eng: GestureEngine, hand: bool) -> EngineView:
+        return cls(
+            eng.gtype, eng.gstate, eng.idx_pinched, eng.mid_pinched,
+            eng.idx_dist, eng.mid_dist, eng.dur_ms, eng.vel,
+            eng.cursor_x, eng.cursor_y, eng.flash_label,
+            eng.landmarks.copy() if hand else None,
+            eng.overlay,
+        )
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  DRAWING
 # ═════════════════════════════════════════════════════════════════════════════
 
-def draw_hand(frame, lm, w, h, eng: GestureEngine):
-    pts = [(int(l.x * w), int(l.y * h)) for l in lm]
+def draw_hand(frame, lm: np.ndarray, w, h, eng: EngineView):
+    pts_np = (lm[:, :2] * (w, h)).astype(np.int32)
+    pts = [tuple(p) for p in pts_np.tolist()]
 
-    # Skeleton
+    # Skeleton — all 23 connections as 6 strips in one call
     sc = (0, 255, 120) if eng.pinched else (50, 180, 50)
-    for s, e in HAND_CONNS:
-        cv2.line(frame, pts[s], pts[e], sc, 2, cv2.LINE_AA)
+    cv2.polylines(frame, [pts_np[s] for s in HAND_STRIPS], False, sc, 2, cv2.LINE_AA)
 
     # Landmarks
-    highlight = {THUMB_TIP, INDEX_TIP, MIDDLE_TIP}
-    for i, p in enumerate(pts):
-        if i in highlight:
-            if i == THUMB_TIP:
-                col = (0, 200, 255)
-            elif i == INDEX_TIP:
-                col = (0, 255, 255) if eng.idx_pinched else (255, 200, 100)
-            else:  # MIDDLE_TIP
-                col = (0, 165, 255) if eng.mid_pinched else (255, 100, 200)
-            cv2.circle(frame, p, 9, col, -1, cv2.LINE_AA)
-            cv2.circle(frame, p, 9, (0, 0, 0), 1, cv2.LINE_AA)
-        else:
-            cv2.circle(frame, p, 4, (255, 255, 255), -1, cv2.LINE_AA)
-            cv2.circle(frame, p, 4, (0, 0, 0), 1, cv2.LINE_AA)
+    for i in _PLAIN_IDS:
+        p = pts[i]
+        cv2.circle(frame, p, 4, (255, 255, 255), -1, cv2.LINE_AA)
+        cv2.circle(frame, p, 4, (0, 0, 0), 1, cv2.LINE_AA)
+
+    tip_cols = (
+        (0, 200, 255),
+        (0, 255, 255) if eng.idx_pinched else (255, 200, 100),
+        (0, 165, 255) if eng.mid_pinched else (255, 100, 200),
+    )
+    for i, col in zip(_HIGHLIGHT, tip_cols):
+        p = pts[i]
+        cv2.circle(frame, p, 9, col, -1, cv2.LINE_AA)
+        cv2.circle(frame, p, 9, (0, 0, 0), 1, cv2.LINE_AA)
 
     # Pinch lines: thumb-to-index and thumb-to-middle
     idx_col = (0, 0, 255) if eng.idx_pinched else (80, 80, 80)
@@ -629,15 +806,37 @@ def draw_hand(frame, lm, w, h, eng: GestureEngine):
                 cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 165, 255), 1, cv2.LINE_AA)
 
 
-def draw_hud(frame, eng: GestureEngine, fps: float):
+TOP_BAR_H    = 70
+BOTTOM_BAR_H = 36
+
+
+@lru_cache(maxsize=4)
+def _legend_sprite(w: int) -> tuple[np.ndarray, np.ndarray]:
+    """Static top-right legend rendered once per frame width → (image, mask)."""
+    img = np.zeros((TOP_BAR_H, w, 3), dtype=np.uint8)
+    cv2.putText(img, "Index = Tap/Hold/Drag", (w - 230, 50),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 255, 255), 1, cv2.LINE_AA)
+    cv2.putText(img, "Middle = Double Tap", (w - 230, 65),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 165, 255), 1, cv2.LINE_AA)
+    mask = (img.max(axis=2) > 0).astype(np.uint8)
+    return img, mask
+
+
+def _shade_bar(bar):
+    """In-place 75% blend toward (10, 10, 10): bar*0.25 + 7.5 on a row-slice view."""
+    cv2.convertScaleAbs(bar, dst=bar, alpha=0.25, beta=7.5)
+
+
+def draw_hud(frame, eng: EngineView, fps: float):
     h, w = frame.shape[:2]
     gt  = eng.gtype
     col = GCOLORS.get(gt, (160, 160, 160))
 
     # ── Top bar ──────────────────────────────────────────────────────
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (0, 0), (w, 70), (10, 10, 10), -1)
-    cv2.addWeighted(overlay, 0.75, frame, 0.25, 0, frame)
+    top = frame[:TOP_BAR_H]
+    _shade_bar(top)
+    legend, legend_mask = _legend_sprite(w)
+    cv2.copyTo(legend, legend_mask, top)
 
     cv2.putText(frame, gt.upper(), (14, 28),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.8, col, 2, cv2.LINE_AA)
@@ -646,16 +845,8 @@ def draw_hud(frame, eng: GestureEngine, fps: float):
     cv2.putText(frame, f"{fps:.0f} FPS", (w - 110, 28),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.65, (80, 180, 255), 2, cv2.LINE_AA)
 
-    # Legend (top-right)
-    cv2.putText(frame, "Index = Tap/Hold/Drag", (w - 230, 50),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 255, 255), 1, cv2.LINE_AA)
-    cv2.putText(frame, "Middle = Double Tap", (w - 230, 65),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 165, 255), 1, cv2.LINE_AA)
-
     # ── Bottom bar ───────────────────────────────────────────────────
-    overlay2 = frame.copy()
-    cv2.rectangle(overlay2, (0, h - 36), (w, h), (10, 10, 10), -1)
-    cv2.addWeighted(overlay2, 0.75, frame, 0.25, 0, frame)
+    _shade_bar(frame[h - BOTTOM_BAR_H:])
 
     info = (f"idx:{eng.idx_dist:.3f}  mid:{eng.mid_dist:.3f}  "
             f"dur:{eng.dur_ms:.0f}ms  vel:{eng.vel:.2f}")
@@ -679,7 +870,7 @@ def draw_hud(frame, eng: GestureEngine, fps: float):
                     cv2.FONT_HERSHEY_SIMPLEX, 2.0, col, 4, cv2.LINE_AA)
 
 
-def draw_cursor(frame, eng: GestureEngine):
+def draw_cursor(frame, eng: EngineView):
     """Draw a persistent cursor pointer at the index finger tip."""
     fh, fw = frame.shape[:2]
     cx = int(eng.cursor_x * fw)
@@ -714,6 +905,176 @@ def draw_cursor(frame, eng: GestureEngine):
     eng.overlay.draw(frame, fw, fh)
 
 
+# ═════════════════════════════════════════════════════════════════════════════
+#  PIPELINE STAGES
+# ═════════════════════════════════════════════════════════════════════════════
+#
+#   camera thread ─newest─▶ capture thread ──▶ MediaPipe (LIVE_STREAM) ──result──▶ engine task
+#                                 │                                                   │
+#                                 └─raw frame─▶ feed task ─(frame, EngineView)─▶ display thread
+#                                                                              outq ──▶ flusher
+#
+# Each hop is a single-slot mailbox: a newer item overwrites an unread one,
+# so a slow stage drops stale work instead of building latency.  Drawing
+# and imshow live on their own thread so rendering never delays a send.
+
+class LatestSlot:
+    """Single-item mailbox from a producer thread to the asyncio loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop  = loop
+        self._item  = None
+        self._ready = asyncio.Event()
+
+    def put_threadsafe(self, item):
+        self._loop.call_soon_threadsafe(self._put, item)
+
+    def _put(self, item):
+        self._item = item
+        self._ready.set()
+
+    async def get(self):
+        await self._ready.wait()
+        self._ready.clear()
+        item, self._item = self._item, None
+        return item
+
+
+class DetectPacer:
+    """
+    Halves the detection rate while nothing interesting can happen:
+    the hand is absent, or idle (no pinch in progress) and has been
+    still for STATIC_FRAMES results.  Any motion or pinch restores
+    full rate on the next result.
+
+    observe() runs on the asyncio loop, should_detect() on the capture
+    thread; the only shared state is the `throttled` bool.
+    """
+
+    def __init__(self):
+        self.throttled = False
+        self._prev = np.full((NUM_LANDMARKS, 3), np.inf, dtype=np.float32)
+        self._static_run = 0
+        self._tick = 0
+
+    def observe(self, lm: np.ndarray | None, engine_idle: bool):
+        if lm is None:
+            self._prev.fill(np.inf)
+            self._static_run = STATIC_FRAMES
+        else:
+            still = float(np.abs(lm - self._prev).max()) < STATIC_DELTA
+            self._static_run = self._static_run + 1 if still else 0
+            np.copyto(self._prev, lm)
+        self.throttled = engine_idle and self._static_run >= STATIC_FRAMES
+
+    def should_detect(self) -> bool:
+        self._tick += 1
+        return not self.throttled or self._tick % 2 == 0
+
+
+class FreshCam:
+    """Background cap.read() loop that keeps only the newest frame.
+
+    Reading continuously keeps the V4L/DirectShow buffer drained, so a
+    momentary stall downstream skips frames instead of replaying old ones.
+    """
+
+    def __init__(self, cap, stop: threading.Event):
+        self._cap   = cap
+        self._stop  = stop
+        self._cond  = threading.Condition()
+        self._frame = None
+        self._thread = threading.Thread(target=self._loop, name="camera", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            ok, f = self._cap.read()
+            if not ok:
+                time.sleep(0.01)
+                continue
+            with self._cond:
+                self._frame = f
+                self._cond.notify()
+
+    def latest(self, timeout: float = 0.1):
+        """Take the newest unread frame, or None if none arrives in time."""
+        with self._cond:
+            if self._frame is None:
+                self._cond.wait(timeout)
+            frame, self._frame = self._frame, None
+        return frame
+
+    def join(self, timeout: float | None = None):
+        self._thread.join(timeout)
+
+
+def capture_worker(cam: FreshCam, det, pacer: DetectPacer, frames: LatestSlot,
+                   stop: threading.Event):
+    """Capture stage: newest frame → mirror/RGB → detect_async → hand off display frame."""
+    # Reused RGB input buffer (sized on the first frame — drivers don't
+    # always honour CAM_WIDTH/CAM_HEIGHT).  mp.Image copies pixels into its
+    # own ImageFrame on construction, so the buffer can be overwritten as
+    # soon as detect_async() returns; a cached mp.Image would go stale.
+    rgb = None
+    ts_ms = 0
+    while not stop.is_set():
+        frame = cam.latest()
+        if frame is None:
+            continue
+
+        if pacer.should_detect():
+            if rgb is None or rgb.shape != frame.shape:
+                rgb = np.empty_like(frame)
+            mirror_rgb(frame, rgb)
+            # LIVE_STREAM needs strictly increasing timestamps
+            ts_ms = max(ts_ms + 1, int(time.monotonic() * 1000))
+            det.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), ts_ms)
+
+        frames.put_threadsafe(frame)   # raw; the display thread mirrors it
+
+
+def offer_latest(q: queue.Queue, item):
+    """put_nowait on a maxsize=1 queue, replacing an unread item."""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        pass
+
+
+def display_worker(display_q: queue.Queue, on_quit, stop: threading.Event):
+    """Display stage: mirror, draw overlays, imshow.  ESC calls on_quit()."""
+    fps = 0.0
+    pt  = time.monotonic()
+    while not stop.is_set():
+        try:
+            frame, view = display_q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        frame = cv2.flip(frame, 1)
+        fh, fw = frame.shape[:2]
+
+        if view.landmarks is not None:
+            draw_hand(frame, view.landmarks, fw, fh, view)
+
+        now = time.monotonic()
+        fps = 1.0 / (now - pt) if (now - pt) > 0 else 0
+        pt  = now
+
+        draw_cursor(frame, view)
+        draw_hud(frame, view, fps)
+        cv2.imshow("Gesture Controller", frame)
+        if cv2.waitKey(1) & 0xFF == 27:
+            on_quit()
+            break
+    cv2.destroyAllWindows()
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  MAIN LOOP
 # ═════════════════════════════════════════════════════════════════════════════
@@ -724,24 +1085,39 @@ async def run():
     cap = cv2.VideoCapture(CAMERA_INDEX)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH,  CAM_WIDTH)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAM_HEIGHT)
+    cap.set(cv2.CAP_PROP_FPS,          TARGET_FPS)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE,   1)   # honoured by V4L2; FreshCam covers the rest
     if not cap.isOpened():
         print(f"[ERR] Cannot open camera {CAMERA_INDEX}")
         sys.exit(1)
     print(f"[INFO] Camera {int(cap.get(3))}×{int(cap.get(4))}")
 
     eng = GestureEngine()
-    fps = 0.0
-    pt  = time.monotonic()
+
+    loop      = asyncio.get_running_loop()
+    frames    = LatestSlot(loop)
+    results   = LatestSlot(loop)
+    display_q = queue.Queue(maxsize=1)
+    stop      = threading.Event()
+    quit_req  = asyncio.Event()
+    pacer   = DetectPacer()
+
+    # LIVE_STREAM mode: detect_async() returns immediately and MediaPipe
+    # pipelines detection on its own threads; results land in `results`.
+    def on_result(result, _image, _ts_ms):
+        results.put_threadsafe(result)
 
     opts = HandLandmarkerOpts(
         base_options=BaseOptions(model_asset_path=model_path),
-        running_mode=VisionRunningMode.VIDEO,
+        running_mode=VisionRunningMode.LIVE_STREAM,
+        result_callback=on_result,
         num_hands=1,
         min_hand_detection_confidence=0.5,
         min_hand_presence_confidence=0.5,
         min_tracking_confidence=0.4,
     )
     det = HandLandmarker.create_from_options(opts)
+    hand_lm = None   # last landmarks seen, redrawn until the next result
 
     ws = None
     drain = None
@@ -764,37 +1140,26 @@ async def run():
                     ping_interval=20, ping_timeout=10, close_timeout=5,
                 )
                 drain = asyncio.create_task(_drain(ws))
+                eng.new_session()
                 print(f"[INFO] WS → {WS_URL}")
             except Exception as e:
                 print(f"[WARN] WS fail ({e}), retry {RECONNECT_DELAY}s")
                 await asyncio.sleep(RECONNECT_DELAY)
 
-    await connect()
-    ts_ms = 0
+    # Outgoing payloads: the engine stage only appends; one flusher task
+    # drains everything queued per wake-up, so nothing upstream awaits a
+    # send and a reconnect doesn't stall capture.  Oldest entries drop
+    # first if the queue overflows during an outage.
+    outq: deque[bytes] = deque(maxlen=SEND_QUEUE_MAX)
+    out_ready = asyncio.Event()
 
-    try:
+    async def flusher():
+        nonlocal ws
         while True:
-            t0 = time.monotonic()
-
-            ok, frame = cap.read()
-            if not ok:
-                await asyncio.sleep(0.01)
-                continue
-
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            img = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-            ts_ms += int(FRAME_INTERVAL * 1000)
-            res = det.detect_for_video(img, ts_ms)
-
-            fh, fw = frame.shape[:2]
-
-            if res.hand_landmarks:
-                lm = res.hand_landmarks[0]
-                draw_hand(frame, lm, fw, fh, eng)
-                payload = eng.update(list(lm))
-                raw = orjson.dumps(payload)
+            await out_ready.wait()
+            out_ready.clear()
+            while outq:
+                raw = outq.popleft()
                 try:
                     await ws.send(raw)
                 except Exception:
@@ -804,24 +1169,58 @@ async def run():
                     ws = None
                     await connect()
 
-            now = time.monotonic()
-            fps = 1.0 / (now - pt) if (now - pt) > 0 else 0
-            pt  = now
+    async def engine_stage():
+        """Gesture engine + encode, driven by detection results."""
+        nonlocal hand_lm
+        while True:
+            res = await results.get()
+            hand_lm = res.hand_landmarks[0] if res.hand_landmarks else None
+            if hand_lm is None:
+                pacer.observe(None, eng.state == eng.S_IDLE)
+                continue
+            raw = eng.update(hand_lm)
+            pacer.observe(eng.landmarks, eng.state == eng.S_IDLE)
+            if raw is not None:
+                outq.append(raw)
+                out_ready.set()
+
+    await connect()
+    flush_task  = asyncio.create_task(flusher())
+    engine_task = asyncio.create_task(engine_stage())
+    cam         = FreshCam(cap, stop)
+    cap_thread  = threading.Thread(
+        target=capture_worker, args=(cam, det, pacer, frames, stop),
+        name="capture", daemon=True,
+    )
+    cap_thread.start()
 
-            draw_cursor(frame, eng)
-            draw_hud(frame, eng, fps)
-            cv2.imshow("Gesture Controller", frame)
-            if cv2.waitKey(1) & 0xFF == 27:
-                break
+    async def display_feed():
+        """Pair each new camera frame with a snapshot of the engine state."""
+        while True:
+            frame = await frames.get()
+            offer_latest(display_q, (frame, EngineView.of(eng, hand_lm is not None)))
+
+    feed_task = asyncio.create_task(display_feed())
+    disp_thread = threading.Thread(
+        target=display_worker,
+        args=(display_q, lambda: loop.call_soon_threadsafe(quit_req.set), stop),
+        name="display", daemon=True,
+    )
+    disp_thread.start()
 
-            sl = FRAME_INTERVAL - (time.monotonic() - t0)
-            if sl > 0:
-                await asyncio.sleep(sl)
+    try:
+        await quit_req.wait()
 
     finally:
+        stop.set()
+        cap_thread.join(timeout=1.0)
+        cam.join(timeout=1.0)
+        disp_thread.join(timeout=1.0)
+        feed_task.cancel()
+        engine_task.cancel()
+        flush_task.cancel()
         det.close()
         cap.release()
-        cv2.destroyAllWindows()
         if drain and not drain.done():
             drain.cancel()
         if ws:
@@ -2,37 +2,76 @@
 Voice & Gesture WebSocket Server  (v3 — Speech + Gesture)
 ──────────────────────────────────────────────────────────
 FastAPI + Uvicorn + orjson
-Optional Redis pub/sub for multi-instance broadcasting.
+Optional Redis Streams for multi-instance broadcasting.
 Falls back to in-memory fan-out when Redis is unavailable.
+Events are JSON objects, or msgpack maps when msgpack is installed; either
+way they are forwarded to subscribers byte-for-byte.
 
 Endpoints:
   ws://host:8000/ws/gestures   — gesture events
   ws://host:8000/ws/speech     — speech events (ASR/STT/EOR)
   POST /api/speech             — receive final transcriptions
   GET  /health                 — system health
+
+WebSocket clients may pass ?group=<key> to join a shard: events only reach
+clients in the same group.  Without it, all clients share the default shard.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import socket
+import time
+import uuid
+import zlib
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import Set
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Collection
 
 import orjson
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
-from starlette.websockets import WebSocketState
+
+try:
+    import fastjsonschema
+except ImportError:              # optional: falls back to a required-keys check
+    fastjsonschema = None
+
+try:
+    import msgpack
+except ImportError:              # optional: JSON-only ingress without it
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:              # optional: single-pass typed decode + validate
+    msgspec = None
 
 # ─── Configuration ───────────────────────────────────────────────────────────
 REDIS_URL = "redis://localhost:6379/0"
-REDIS_CHANNEL_GESTURE = "gestures:broadcast"
+REDIS_CHANNEL_GESTURE = "gestures:broadcast"   # stream key prefixes (":<shard>")
 REDIS_CHANNEL_SPEECH  = "speech:broadcast"
+N_SHARDS              = 8          # client groups hash onto this many streams
+REDIS_STREAM_MAXLEN   = 10_000     # approximate trim on XADD
+REDIS_BATCH_MAX       = 16         # XADDs per pipelined round trip …
+REDIS_FLUSH_SECS      = 0.001      # … or flushed after this long
+REDIS_READ_COUNT      = 64
+REDIS_READ_BLOCK_MS   = 100
 HOST = "0.0.0.0"
 PORT = 8000
 GESTURE_REQUIRED_KEYS = {"event_id", "timestamp", "gesture"}
 SPEECH_REQUIRED_KEYS  = {"event_id", "timestamp", "speech"}
+TCP_KEEPIDLE_SECS  = 30        # probe idle clients after 30 s …
+TCP_KEEPINTVL_SECS = 15        # … every 15 s …
+TCP_KEEPCNT        = 4         # … and drop them after 4 misses
+TCP_SNDBUF_BYTES   = 256 * 1024
+SPEECH_OFFLOAD_BYTES = 64 * 1024   # parse speech events this big off-loop
+FANOUT_THRESHOLD = 32          # above this many targets, send concurrently
+COALESCE_WINDOW  = 0.005       # s — events arriving within this window share a frame
 
 logging.basicConfig(
     level=logging.INFO,
@@ -46,21 +85,46 @@ log = logging.getLogger("server")
 class ConnectionManager:
     """
     Track live WebSocket clients and fan-out messages.
-    Uses Redis pub/sub when available; falls back to in-memory broadcast.
+    Uses a Redis stream when available; falls back to in-memory broadcast.
+    Ingested events are XADDed in pipelined batches and every instance
+    XREADs the stream from its own cursor, so all instances see every event.
+
+    Clients join a shard chosen by their `?group=` key (see shard_of);
+    events only reach clients in the sender's shard, and each shard has its
+    own stream.  Clients without a group all share one shard.
 
     IMPORTANT: broadcast excludes the sender to prevent receive-buffer overflow
     on producer clients that only send (never read).
+
+    Events are coalesced for COALESCE_WINDOW: a lone event goes out as-is,
+    several go out as one JSON array frame (consumers accept both) when
+    every event in it was fully validated (FULL_VALIDATION), else one
+    frame each.  A sender never receives its own events back.
     """
 
     def __init__(self, name: str, redis_channel: str) -> None:
         self._name = name
         self._redis_channel = redis_channel
-        self._clients: Set[WebSocket] = set()
+        self._streams = [f"{redis_channel}:{k}" for k in range(N_SHARDS)]
+        self._stream_shard = {name.encode(): k for k, name in enumerate(self._streams)}
+        # Clients in slot-indexed parallel arrays; a slot is reused after its
+        # client leaves.  _client_send holds the raw ASGI send (see _asgi_send).
+        self._client_ws:   list[WebSocket | None] = []
+        self._client_send: list[Callable[[dict], Awaitable[None]] | None] = []
+        self._client_alive = bytearray()
+        self._client_shard = bytearray()
+        self._slot: dict[WebSocket, int] = {}
+        self._free: deque[int] = deque()
         self._redis = None
-        self._pubsub = None
         self._listener_task: asyncio.Task | None = None
+        self._xadd_pending: list[tuple[int, bytes]] = []
+        self._xadd_ready = asyncio.Event()
+        self._xadd_full = asyncio.Event()
+        self._xadd_task: asyncio.Task | None = None
         self._use_redis: bool = False
         self._msg_count: int = 0
+        self._pending: dict[int, list[tuple[bytes, WebSocket | None]]] = {}
+        self._flush_task: asyncio.Task | None = None
 
     # ── Lifecycle ────────────────────────────────────────────────────────
     async def startup(self) -> None:
@@ -72,10 +136,11 @@ class ConnectionManager:
             self._use_redis = True
             log.info("[%s] Redis connected  ✓  (%s)", self._name, REDIS_URL)
 
-            self._pubsub = self._redis.pubsub()
-            await self._pubsub.subscribe(self._redis_channel)
-            self._listener_task = asyncio.create_task(self._redis_listener())
-            log.info("[%s] Subscribed to channel '%s'", self._name, self._redis_channel)
+            self._listener_task = asyncio.create_task(
+                self._redis_listener(await self._stream_tail()))
+            self._xadd_task = asyncio.create_task(self._xadd_flusher())
+            log.info("[%s] Reading streams '%s:0..%d'",
+                     self._name, self._redis_channel, N_SHARDS - 1)
 
         except Exception as exc:
             self._use_redis = False
@@ -86,18 +151,15 @@ class ConnectionManager:
             )
 
     async def shutdown(self) -> None:
-        if self._listener_task:
-            self._listener_task.cancel()
-            try:
-                await self._listener_task
-            except asyncio.CancelledError:
-                pass
-        if self._pubsub:
-            try:
-                await self._pubsub.unsubscribe(self._redis_channel)
-                await self._pubsub.close()
-            except Exception:
-                pass
+        if self._flush_task:
+            self._flush_task.cancel()
+        for task in (self._xadd_task, self._listener_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         if self._redis:
             try:
                 await self._redis.close()
@@ -106,66 +168,221 @@ class ConnectionManager:
         log.info("[%s] Shutdown complete  ✓", self._name)
 
     # ── Client management ────────────────────────────────────────────────
-    async def connect(self, ws: WebSocket) -> None:
+    async def connect(self, ws: WebSocket, shard_key: str = "") -> None:
         await ws.accept()
-        self._clients.add(ws)
-        log.info("[%s] Client connected   (%d total)", self._name, len(self._clients))
+        send = _asgi_send(ws)
+        shard = shard_of(shard_key)
+        if self._free:
+            i = self._free.popleft()
+            self._client_ws[i], self._client_send[i] = ws, send
+            self._client_alive[i] = 1
+            self._client_shard[i] = shard
+        else:
+            i = len(self._client_ws)
+            self._client_ws.append(ws)
+            self._client_send.append(send)
+            self._client_alive.append(1)
+            self._client_shard.append(shard)
+        self._slot[ws] = i
+        log.info("[%s] Client connected   (%d total, shard %d)",
+                 self._name, len(self._slot), shard)
+        log.debug("[%s] Client offered extensions: %s (deflate disabled server-side)",
+                  self._name, ws.headers.get("sec-websocket-extensions", "none"))
 
     def disconnect(self, ws: WebSocket) -> None:
-        self._clients.discard(ws)
-        log.info("[%s] Client disconnected (%d total)", self._name, len(self._clients))
+        i = self._slot.get(ws)
+        if i is not None:
+            self._drop(i)
+        log.info("[%s] Client disconnected (%d total)", self._name, len(self._slot))
+
+    def _drop(self, i: int) -> None:
+        ws = self._client_ws[i]
+        if ws is None:
+            return
+        del self._slot[ws]
+        self._client_ws[i] = self._client_send[i] = None
+        self._client_alive[i] = 0
+        self._free.append(i)
+        # Compact: trim dead slots off the end so the scan stays short
+        n = len(self._client_alive)
+        while n and not self._client_alive[n - 1]:
+            n -= 1
+        if n < len(self._client_alive):
+            del self._client_ws[n:], self._client_send[n:]
+            del self._client_alive[n:], self._client_shard[n:]
+            self._free = deque(j for j in self._free if j < n)
 
     @property
     def client_count(self) -> int:
-        return len(self._clients)
+        return len(self._slot)
 
     # ── Ingest (sender-excluded broadcast) ───────────────────────────────
     async def ingest(self, raw: bytes, sender: WebSocket) -> None:
         """Validate, log, and broadcast — excluding the sender."""
         self._msg_count += 1
+        shard = self._client_shard[self._slot[sender]] if sender in self._slot else 0
 
         if self._use_redis and self._redis:
-            await self._redis.publish(self._redis_channel, raw)
+            self._xadd_pending.append((shard, raw))
+            self._xadd_ready.set()
+            if len(self._xadd_pending) >= REDIS_BATCH_MAX:
+                self._xadd_full.set()
         else:
-            await self._broadcast_local(raw, exclude=sender)
+            self._enqueue(raw, sender, shard)
 
     # ── Broadcast to all (no exclusion — for server-originated events) ───
     async def broadcast_all(self, raw: bytes) -> None:
         """Broadcast to ALL connected clients (used for API-injected events)."""
-        await self._broadcast_local(raw, exclude=None)
-
-    # ── Redis listener ───────────────────────────────────────────────────
-    async def _redis_listener(self) -> None:
-        assert self._pubsub is not None
-        async for message in self._pubsub.listen():
-            if message["type"] != "message":
+        await self._broadcast_local(raw)
+
+    # ── Coalescing ───────────────────────────────────────────────────────
+    def _enqueue(self, raw: bytes, sender: WebSocket | None, shard: int) -> None:
+        self._pending.setdefault(shard, []).append((raw, sender))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(COALESCE_WINDOW))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        by_shard = self._pending
+        self._pending = {}
+        self._flush_task = None
+        for shard, pending in by_shard.items():
+            senders = {src for _, src in pending if src is not None}
+            # Clients that sent nothing this window get the whole batch …
+            await self._send_batch([raw for raw, _ in pending], exclude=senders, shard=shard)
+            # … and each sender gets everyone else's events, never its own
+            for sender in senders:
+                others = [raw for raw, src in pending if src is not sender]
+                if others:
+                    await self._send_batch(others, only=sender)
+
+    async def _send_batch(self, events: list[bytes], **target) -> None:
+        if len(events) == 1:
+            frames = events
+        elif FULL_VALIDATION and all(p[:1] == b"{" for p in events):
+            frames = [b"[" + b",".join(events) + b"]"]
+        else:
+            # msgpack events can't join a JSON array, and an event that only
+            # passed the byte scan may be malformed — it mustn't take the
+            # rest of the frame down with it
+            frames = events
+        for payload in frames:
+            await self._broadcast_local(payload, **target)
+
+    # ── Redis stream ─────────────────────────────────────────────────────
+    async def _xadd_flusher(self) -> None:
+        """Batch pending events into one pipelined XADD round trip."""
+        # One pipeline object for the task's lifetime; execute() resets it
+        pipe = self._redis.pipeline(transaction=False)
+        while True:
+            await self._xadd_ready.wait()
+            if not self._xadd_full.is_set():
+                # Flush after REDIS_FLUSH_SECS, or as soon as a batch fills
+                try:
+                    await asyncio.wait_for(self._xadd_full.wait(), REDIS_FLUSH_SECS)
+                except TimeoutError:
+                    pass
+            batch, self._xadd_pending = self._xadd_pending, []
+            self._xadd_ready.clear()
+            self._xadd_full.clear()
+            if not batch:
                 continue
-            data: bytes = message["data"]
-            await self._broadcast_local(data, exclude=None)
+            for shard, raw in batch:
+                pipe.xadd(self._streams[shard], {b"d": raw},
+                          maxlen=REDIS_STREAM_MAXLEN, approximate=True)
+            try:
+                await pipe.execute()
+            except Exception as exc:
+                pipe.reset()
+                log.warning("[%s] XADD batch of %d failed: %s", self._name, len(batch), exc)
+
+    async def _stream_tail(self) -> dict[str, bytes | str]:
+        """Last entry ID of each shard stream — new events are read after it."""
+        cursors: dict[str, bytes | str] = {}
+        for name in self._streams:
+            try:
+                info = await self._redis.xinfo_stream(name)
+                cursors[name] = info["last-generated-id"]
+            except Exception:
+                cursors[name] = "0-0"   # stream doesn't exist yet
+        return cursors
+
+    async def _redis_listener(self, cursors: dict[str, bytes | str]) -> None:
+        # Plain XREAD rather than a consumer group: groups split entries
+        # between consumers, but every instance must broadcast every event.
+        # One blocking XREAD covers all shard streams.
+        while True:
+            resp = await self._redis.xread(
+                cursors, count=REDIS_READ_COUNT, block=REDIS_READ_BLOCK_MS,
+            )
+            for stream, entries in resp or ():
+                shard = self._stream_shard[stream]
+                for entry_id, fields in entries:
+                    self._enqueue(fields[b"d"], None, shard)
+                cursors[self._streams[shard]] = entries[-1][0]
 
     # ── Local broadcast ──────────────────────────────────────────────────
     async def _broadcast_local(
-        self, data: bytes, *, exclude: WebSocket | None = None
+        self, data: bytes, *, exclude: Collection[WebSocket] = (),
+        shard: int | None = None, only: WebSocket | None = None,
     ) -> None:
-        """Send to all local clients except `exclude`. Drop dead sockets."""
-        targets = [ws for ws in self._clients if ws is not exclude]
+        """
+        Send to local clients in `shard` (all if None) not in `exclude`, or
+        to just `only` if given. Drop dead sockets.
+        """
+        slot = self._slot
+        conns, sends, shards = self._client_ws, self._client_send, self._client_shard
+        # Snapshot (ws, send) up front: slots can be freed/reused while we await
+        if only is not None:
+            i = slot.get(only)
+            targets = [(conns[i], sends[i])] if i is not None and self._client_alive[i] else []
+        else:
+            skip = {slot[ws] for ws in exclude if ws in slot}
+            targets = [(conns[i], sends[i]) for i, alive in enumerate(self._client_alive)
+                       if alive and i not in skip and (shard is None or shards[i] == shard)]
         if not targets:
             return
 
-        async def _safe_send(ws: WebSocket) -> WebSocket | None:
+        # One ASGI message shared by every recipient; servers only read it
+        msg = {"type": "websocket.send", "bytes": data}
+        stale: list[WebSocket] = []
+
+        async def _safe_send(ws: WebSocket, send) -> None:
             try:
-                if ws.client_state == WebSocketState.CONNECTED:
-                    await ws.send_bytes(data)
-                    return None
-                else:
-                    return ws  # stale
-            except Exception:
-                return ws  # stale
+                await send(msg)
+            except Exception:  # RuntimeError/OSError when closed mid-send
+                stale.append(ws)
+
+        if len(targets) > FANOUT_THRESHOLD:
+            # Wide fan-out: overlap sends so one slow socket can't stall the rest
+            async with asyncio.TaskGroup() as tg:
+                for ws, send in targets:
+                    tg.create_task(_safe_send(ws, send))
+        else:
+            # Typical case (a handful of consumers): plain awaits, no Task/Future
+            # allocation per recipient
+            for ws, send in targets:
+                await _safe_send(ws, send)
+
+        for ws in stale:
+            i = slot.get(ws)
+            if i is not None:
+                self._drop(i)
+
 
-        results = await asyncio.gather(*[_safe_send(ws) for ws in targets])
-        for stale in results:
-            if stale is not None:
-                self._clients.discard(stale)
+def shard_of(key: str) -> int:
+    """Stable shard for a client group key (CRC32, so every instance agrees)."""
+    return zlib.crc32(key.encode()) % N_SHARDS
+
+
+def _asgi_send(ws: WebSocket) -> Callable[[dict], Awaitable[None]]:
+    """The connection's raw ASGI send, skipping Starlette's per-call wrapper.
+
+    Falls back to ws.send (which accepts the same message dict) if Starlette
+    ever stops exposing `_send`.
+    """
+    send: Any = getattr(ws, "_send", None)
+    return send if callable(send) else ws.send
 
 
 gesture_manager = ConnectionManager("gesture", REDIS_CHANNEL_GESTURE)
@@ -194,36 +411,152 @@ app = FastAPI(
 
 
 # ─── Lightweight validation ─────────────────────────────────────────────────
+# With msgspec, every event gets the full typed decode (one C pass) and
+# nothing else; with fastjsonschema, every event is parsed and run through
+# the compiled schema.  Without either, a byte scan is the fast path: producers emit
+# small JSON objects with the required keys as literal ASCII, so a few
+# bytes.find() calls confirm them without building a dict.  Anything that
+# misses falls through to a real parse.  The scan can't see types or JSON
+# syntax, so events it accepted may be malformed.
+_GESTURE_KEY_LITERALS = tuple(f'"{k}"'.encode() for k in sorted(GESTURE_REQUIRED_KEYS))
+_SPEECH_KEY_LITERALS  = tuple(f'"{k}"'.encode() for k in sorted(SPEECH_REQUIRED_KEYS))
+
+
+def _has_keys(raw: bytes, literals: tuple[bytes, ...]) -> bool:
+    if not (raw[:1] == b"{" and raw.rstrip()[-1:] == b"}"):
+        return False
+    for lit in literals:
+        if raw.find(lit) < 0:
+            return False
+    return True
+
+
+# Full check on a parsed dict, compiled by fastjsonschema to straight-line
+# Python when installed (used when msgspec isn't).  It runs on every event,
+# so constraints added here (enums, lengths) apply to all traffic.
+def _event_schema(body_key: str) -> dict:
+    return {
+        "type": "object",
+        "required": ["event_id", "timestamp", body_key],
+        "properties": {
+            "event_id":  {"type": "string"},
+            "timestamp": {"type": ["string", "number"]},   # ISO-8601 or epoch ns
+            body_key:    {"type": "object"},
+        },
+    }
+
+
+def _compile_checker(body_key: str, required: set[str]) -> Callable[[Any], bool]:
+    if fastjsonschema is not None:
+        check = fastjsonschema.compile(_event_schema(body_key))
+
+        def _schema_ok(obj: Any) -> bool:
+            try:
+                check(obj)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+        return _schema_ok
+    return lambda obj: isinstance(obj, dict) and required.issubset(obj)
+
+
+# msgpack map markers: fixmap (0x80–0x8f), map16, map32.  JSON objects
+# always start with '{', so the first byte tells the two encodings apart.
+_MSGPACK_MAP_MARKERS = frozenset(range(0x80, 0x90)) | {0xDE, 0xDF}
+
+
+def _is_msgpack(raw: bytes) -> bool:
+    return bool(raw) and raw[0] in _MSGPACK_MAP_MARKERS
+
+
+# True when every accepted event has been fully parsed and type-checked
+# (no byte-scan shortcut)
+FULL_VALIDATION = msgspec is not None or fastjsonschema is not None
+
+
+def _make_validator(body_key: str, required: set[str],
+                    literals: tuple[bytes, ...]) -> Callable[[bytes], bool]:
+    """
+    raw → valid?  With msgspec, decoding and type-checking against a Struct
+    happen in one C pass and are the only check.  Otherwise parse with
+    orjson/msgpack and run the schema check above on the resulting dict —
+    preceded by the byte scan only when there's no compiled schema.
+    """
+    if msgspec is not None:
+        # Same constraints as _event_schema; unknown fields are ignored
+        struct = msgspec.defstruct(f"{body_key.title()}Event", [
+            ("event_id",  str),
+            ("timestamp", str | int | float),
+            (body_key,    dict),
+        ])
+        json_dec, mp_dec = msgspec.json.Decoder(struct), msgspec.msgpack.Decoder(struct)
+
+        def _valid(raw: bytes) -> bool:
+            try:
+                (mp_dec if _is_msgpack(raw) else json_dec).decode(raw)
+            except msgspec.DecodeError:       # includes ValidationError
+                return False
+            return True
+        return _valid
+
+    is_ok = _compile_checker(body_key, required)
+    scan_first = fastjsonschema is None
+
+    def _valid(raw: bytes) -> bool:
+        if scan_first and _has_keys(raw, literals):
+            return True
+        if _is_msgpack(raw):
+            if msgpack is None:
+                return False
+            # Binary producers: validated here, forwarded to consumers untouched
+            try:
+                obj = msgpack.unpackb(raw, raw=False)
+            except Exception:
+                return False
+        else:
+            try:
+                obj = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                return False
+        return is_ok(obj)
+    return _valid
+
+
+_GESTURE_VALID = _make_validator("gesture", GESTURE_REQUIRED_KEYS, _GESTURE_KEY_LITERALS)
+_SPEECH_VALID  = _make_validator("speech",  SPEECH_REQUIRED_KEYS,  _SPEECH_KEY_LITERALS)
+
+
 def validate_gesture(raw: bytes) -> bytes | None:
-    """Check required keys exist. Return raw bytes untouched if valid."""
-    try:
-        obj = orjson.loads(raw)
-    except orjson.JSONDecodeError:
-        return None
-    if not isinstance(obj, dict):
-        return None
-    if not GESTURE_REQUIRED_KEYS.issubset(obj):
-        return None
-    return raw
+    """Validate one event (see above). Return raw bytes untouched if valid."""
+    if _GESTURE_VALID(raw):
+        return raw
+    return None
 
 
 def validate_speech(raw: bytes) -> bytes | None:
-    """Check required keys exist. Return raw bytes untouched if valid."""
-    try:
-        obj = orjson.loads(raw)
-    except orjson.JSONDecodeError:
-        return None
-    if not isinstance(obj, dict):
-        return None
-    if not SPEECH_REQUIRED_KEYS.issubset(obj):
-        return None
-    return raw
+    """Validate one event (see above). Return raw bytes untouched if valid."""
+    if _SPEECH_VALID(raw):
+        return raw
+    return None
+
+
+async def validate_speech_async(raw: bytes) -> bytes | None:
+    """
+    validate_speech(), with oversized payloads parsed on a worker thread.
+    A thread hop costs tens of µs — more than parsing a typical transcript —
+    so only payloads past SPEECH_OFFLOAD_BYTES leave the loop, and (when the
+    byte scan is in use) only when it can't vouch for them.
+    """
+    if len(raw) < SPEECH_OFFLOAD_BYTES or (
+            not FULL_VALIDATION and _has_keys(raw, _SPEECH_KEY_LITERALS)):
+        return validate_speech(raw)
+    return await asyncio.to_thread(validate_speech, raw)
 
 
 # ─── WebSocket Endpoints ────────────────────────────────────────────────────
 @app.websocket("/ws/gestures")
 async def ws_gestures(ws: WebSocket) -> None:
-    await gesture_manager.connect(ws)
+    await gesture_manager.connect(ws, ws.query_params.get("group", ""))
     try:
         while True:
             message = await ws.receive()
@@ -250,7 +583,7 @@ async def ws_gestures(ws: WebSocket) -> None:
 
 @app.websocket("/ws/speech")
 async def ws_speech(ws: WebSocket) -> None:
-    await speech_manager.connect(ws)
+    await speech_manager.connect(ws, ws.query_params.get("group", ""))
     try:
         while True:
             message = await ws.receive()
@@ -262,7 +595,7 @@ async def ws_speech(ws: WebSocket) -> None:
             else:
                 continue
 
-            validated = validate_speech(raw)
+            validated = await validate_speech_async(raw)
             if validated is None:
                 continue
 
@@ -283,18 +616,28 @@ class SpeechPayload(BaseModel):
     duration_ms: float = 0.0
 
 
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_iso_now() -> str:
+    """UTC ISO-8601 timestamp; the date-time prefix is formatted once per second."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return f"{_ts_cache[1]}.{ns // 1000:06d}+00:00"
+
+
 @app.post("/api/speech")
 async def receive_speech(payload: SpeechPayload):
     """
     Receive a final transcription from the speech client (or any external source).
     Broadcasts the transcript to all /ws/speech subscribers.
     """
-    import uuid
-    from datetime import datetime, timezone
-
+    event_id = f"evt_{uuid.uuid4().hex[:12]}"
     event = {
-        "event_id":  f"evt_{uuid.uuid4().hex[:12]}",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "event_id":  event_id,
+        "timestamp": _utc_iso_now(),
         "speech": {
             "type":  "transcript",
             "state": "final",
@@ -314,7 +657,7 @@ async def receive_speech(payload: SpeechPayload):
 
     return {
         "status": "ok",
-        "event_id": event["event_id"],
+        "event_id": event_id,
         "text": payload.text,
     }
 
@@ -338,12 +681,38 @@ async def health():
 
 
 # ─── Entrypoint ──────────────────────────────────────────────────────────────
+def _listen_socket() -> socket.socket:
+    """
+    Bound listening socket with keepalive + send-buffer tuning.
+    Starlette doesn't expose per-connection sockets, but accepted sockets
+    inherit these options from the listener (Linux and Windows alike).
+    TCP_NODELAY needs nothing here: asyncio/uvloop set it on every transport.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name != "nt":   # on Windows SO_REUSEADDR allows port hijacking
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SNDBUF_BYTES)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPIDLE_SECS)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPINTVL_SECS)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPCNT)
+    elif hasattr(socket, "SIO_KEEPALIVE_VALS"):
+        sock.ioctl(socket.SIO_KEEPALIVE_VALS,
+                   (1, TCP_KEEPIDLE_SECS * 1000, TCP_KEEPINTVL_SECS * 1000))
+    sock.bind((HOST, PORT))
+    return sock
+
+
 if __name__ == "__main__":
-    uvicorn.run(
+    config = uvicorn.Config(
         "server:app",
         host=HOST,
         port=PORT,
         log_level="info",
-        ws="websockets",
-        loop="asyncio",
+        ws="websockets",              # C-accelerated frame masking
+        ws_per_message_deflate=False, # events are tiny; deflate only costs CPU
+        loop="auto",                  # uvloop where installed (not on Windows)
+        http="auto",                  # httptools where installed
     )
+    uvicorn.Server(config).run(sockets=[_listen_socket()])
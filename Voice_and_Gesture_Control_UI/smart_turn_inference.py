@@ -12,8 +12,10 @@ Based on: https://github.com/pipecat-ai/smart-turn
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import threading
 import time
 import urllib.request
 from pathlib import Path
@@ -36,11 +38,28 @@ SMART_TURN_URL = (
 )
 SMART_TURN_PATH = MODELS_DIR / "smart-turn-v3.2-cpu.onnx"
 
+# Set SMART_TURN_INT8=0 to load the model file exactly as shipped (skips
+# the dynamic-quantization step below) — rollback switch if INT8 drifts.
+SMART_TURN_INT8 = os.getenv("SMART_TURN_INT8", "1") != "0"
+
 # ─── Audio constants ────────────────────────────────────────────────────────
 SAMPLE_RATE = 16_000
 SILERO_CHUNK = 512          # Silero VAD native chunk size at 16 kHz
 MAX_TURN_SECS = 8           # Smart Turn maximum input length
 
+# Whisper log-mel front end (matches transformers' WhisperFeatureExtractor)
+N_FFT      = 400
+HOP_LENGTH = 160
+N_FRAMES   = MAX_TURN_SECS * SAMPLE_RATE // HOP_LENGTH   # 800
+
+# Preferred ORT providers, best first; only those present in the installed
+# onnxruntime build are used (plain CPU is always available).
+SMART_TURN_PROVIDERS = (
+    "DnnlExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CPUExecutionProvider",
+)
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  SILERO VAD — Neural network speech probability
@@ -53,54 +72,95 @@ class SileroVAD:
 
     CONTEXT_SIZE = 64  # Silero internal context at 16 kHz
     RESET_INTERVAL = 5.0  # seconds — reset internal state periodically
+    RESET_CHUNKS = int(RESET_INTERVAL * SAMPLE_RATE / SILERO_CHUNK)  # 156 chunks
 
     def __init__(self, model_path: str | Path | None = None):
         path = str(model_path or _ensure_model(SILERO_VAD_PATH, SILERO_VAD_URL))
+        # One 512-sample chunk per call: a thread pool only adds wakeup
+        # latency, so run everything inline on the caller's thread.
         opts = ort.SessionOptions()
+        opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
         opts.inter_op_num_threads = 1
         opts.intra_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
         self.session = ort.InferenceSession(
             path, providers=["CPUExecutionProvider"], sess_options=opts,
         )
-        self._state: np.ndarray | None = None
-        self._context: np.ndarray | None = None
-        self._last_reset: float = 0.0
+        # Model input, reused every call: [context (64) | chunk (512)].
+        # The context half is refreshed in place from the tail after each run.
+        self._buf = np.zeros((1, self.CONTEXT_SIZE + SILERO_CHUNK), dtype=np.float32)
+        self._ctx   = self._buf[0, :self.CONTEXT_SIZE]     # views, made once
+        self._chunk = self._buf[0, self.CONTEXT_SIZE:]
+        self._tail  = self._buf[0, -self.CONTEXT_SIZE:]
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        # Recurrent state is double-buffered: each run reads one half and
+        # writes the other, so ORT never aliases an input with an output.
+        self._states = (np.zeros((2, 1, 128), dtype=np.float32),
+                        np.zeros((2, 1, 128), dtype=np.float32))
+        self._cur = 0
+
+        # IOBinding over the buffers above — OrtValues on CPU wrap the NumPy
+        # memory, so nothing is marshalled in or allocated out per call.
+        # One fully-bound IOBinding per state parity, so prob() never rebinds.
+        ov = ort.OrtValue.ortvalue_from_numpy
+        out, state_out = self.session.get_outputs()[:2]
+        self._out = np.zeros(_static_shape(out.shape), dtype=np.float32)
+        inp, outp, sr = ov(self._buf), ov(self._out), ov(self._sr)
+        states = tuple(ov(a) for a in self._states)
+        self._ios = []
+        for cur in (0, 1):
+            io = self.session.io_binding()
+            io.bind_ortvalue_input("input", inp)
+            io.bind_ortvalue_input("sr", sr)
+            io.bind_ortvalue_input("state", states[cur])
+            io.bind_ortvalue_output(out.name, outp)
+            io.bind_ortvalue_output(state_out.name, states[cur ^ 1])
+            self._ios.append(io)
+        self._run = self.session.run_with_iobinding
+
+        self._chunks_since_reset = 0
         self._init_states()
         log.info("Silero VAD loaded  ✓")
 
     def _init_states(self) -> None:
-        self._state = np.zeros((2, 1, 128), dtype=np.float32)
-        self._context = np.zeros((1, self.CONTEXT_SIZE), dtype=np.float32)
-        self._last_reset = time.monotonic()
-
-    def _maybe_reset(self) -> None:
-        if (time.monotonic() - self._last_reset) >= self.RESET_INTERVAL:
-            self._init_states()
+        self._states[self._cur].fill(0.0)
+        self._ctx.fill(0.0)
+        self._chunks_since_reset = 0
 
     def prob(self, chunk_f32: np.ndarray) -> float:
         """
         Compute speech probability for one 512-sample chunk (float32, mono).
         Returns scalar float in [0.0, 1.0].
         """
-        x = np.reshape(chunk_f32, (1, -1))
-        if x.shape[1] != SILERO_CHUNK:
-            raise ValueError(f"Expected {SILERO_CHUNK} samples, got {x.shape[1]}")
+        if chunk_f32.size != SILERO_CHUNK:
+            raise ValueError(f"Expected {SILERO_CHUNK} samples, got {chunk_f32.size}")
 
-        # Prepend context
-        x = np.concatenate((self._context, x), axis=1)
+        self._chunk[:] = chunk_f32.reshape(-1)   # casts if needed
 
-        ort_inputs = {
-            "input": x.astype(np.float32),
-            "state": self._state,
-            "sr": np.array(SAMPLE_RATE, dtype=np.int64),
-        }
-        out, self._state = self.session.run(None, ort_inputs)
+        cur = self._cur
+        self._run(self._ios[cur])
+        self._cur = cur ^ 1
 
-        # Update context (keep last 64 samples)
-        self._context = x[:, -self.CONTEXT_SIZE :]
-        self._maybe_reset()
+        # Update context (keep last 64 samples) — a 64-float memmove
+        self._ctx[:] = self._tail
 
-        return float(out[0][0])
+        # Periodic reset, counted in chunks (audio time) — no clock read
+        self._chunks_since_reset += 1
+        if self._chunks_since_reset >= self.RESET_CHUNKS:
+            self._init_states()
+
+        return float(self._out.flat[0])
+
+    def prob_batch(self, chunks) -> np.ndarray:
+        """
+        Speech probabilities for consecutive chunks of the same stream.
+        Silero is recurrent (state and context carry from chunk to chunk),
+        so the chunks are run back-to-back rather than as one batch axis.
+        """
+        probs = np.empty(len(chunks), dtype=np.float32)
+        for i, chunk in enumerate(chunks):
+            probs[i] = self.prob(chunk)
+        return probs
 
     def reset(self) -> None:
         """Force-reset internal state (call between turns)."""
@@ -118,23 +178,51 @@ class SmartTurnInference:
     """
 
     def __init__(self, model_path: str | Path | None = None, cpu_count: int = 1):
-        path = str(model_path or _ensure_model(SMART_TURN_PATH, SMART_TURN_URL))
+        path = Path(model_path or _ensure_model(SMART_TURN_PATH, SMART_TURN_URL))
+        if SMART_TURN_INT8:
+            path = _int8_model(path)
 
         so = ort.SessionOptions()
-        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        # Parallel executor only pays off with spare cores for independent nodes
+        so.execution_mode = (ort.ExecutionMode.ORT_PARALLEL if cpu_count > 1
+                             else ort.ExecutionMode.ORT_SEQUENTIAL)
         so.inter_op_num_threads = cpu_count
         so.intra_op_num_threads = max(cpu_count, 2)
         so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.enable_cpu_mem_arena = True
+        so.add_session_config_entry("session.intra_op.allow_spinning", "1")
+        so.add_session_config_entry("session.dynamic_block_base", "4")
 
+        available = set(ort.get_available_providers())
+        providers = [p for p in SMART_TURN_PROVIDERS if p in available]
         self.session = ort.InferenceSession(
-            path, providers=["CPUExecutionProvider"], sess_options=so,
+            str(path), providers=providers, sess_options=so,
         )
 
-        # Load WhisperFeatureExtractor (Whisper Tiny backbone)
-        from transformers import WhisperFeatureExtractor
-        self.feature_extractor = WhisperFeatureExtractor(chunk_length=MAX_TURN_SECS)
-
-        log.info("Smart Turn v3.2 loaded  ✓  (cpu_count=%d)", cpu_count)
+        # IOBinding: features are copied into one persistent buffer and the
+        # (1, 1) probability lands in another — no per-call OrtValues.
+        inp = self.session.get_inputs()[0]
+        n_mels = inp.shape[1] if isinstance(inp.shape[1], int) else 80
+        self._features = np.zeros((1, n_mels, N_FRAMES), dtype=np.float32)
+        out = self.session.get_outputs()[0]
+        self._prob = np.zeros(_static_shape(out.shape), dtype=np.float32)
+        self._io = self.session.io_binding()
+        self._io.bind_ortvalue_input(
+            inp.name, ort.OrtValue.ortvalue_from_numpy(self._features))
+        self._io.bind_ortvalue_output(
+            out.name, ort.OrtValue.ortvalue_from_numpy(self._prob))
+
+        # Whisper front end, precomputed once (replaces WhisperFeatureExtractor)
+        self._window = np.hanning(N_FFT + 1)[:-1].astype(np.float32)   # periodic Hann
+        self._mel_fb = _mel_filter_bank(n_mels)
+        self._padded = np.zeros(MAX_TURN_SECS * SAMPLE_RATE + N_FFT, dtype=np.float32)
+        # Fixed-length model window, filled in place by predict*/ before _log_mel
+        self._audio_buf = np.zeros(MAX_TURN_SECS * SAMPLE_RATE, dtype=np.float32)
+        # The buffers above are shared, so predictions run one at a time
+        self._lock = threading.Lock()
+
+        log.info("Smart Turn v3.2 loaded  ✓  (cpu_count=%d, %s, %s)",
+                 cpu_count, path.name, self.session.get_providers()[0])
 
     def predict(self, audio_f32: np.ndarray) -> dict:
         """
@@ -147,29 +235,47 @@ class SmartTurnInference:
             {'prediction': 1 (complete) | 0 (incomplete),
              'probability': float (sigmoid probability of completion)}
         """
-        # Truncate to last 8 seconds or pad with leading zeros
-        audio = _truncate_or_pad(audio_f32, n_seconds=MAX_TURN_SECS)
-
-        # Extract Whisper features
-        inputs = self.feature_extractor(
-            audio,
-            sampling_rate=SAMPLE_RATE,
-            return_tensors="np",
-            padding="max_length",
-            max_length=MAX_TURN_SECS * SAMPLE_RATE,
-            truncation=True,
-            do_normalize=True,
-        )
+        with self._lock:
+            # Truncate to last 8 seconds or pad with leading zeros
+            _truncate_or_pad(audio_f32, self._audio_buf)
+            return self._infer()
+
+    async def predict_async(self, audio_f32: np.ndarray) -> dict:
+        """predict() on a worker thread, so the event loop keeps running."""
+        return await asyncio.to_thread(self.predict, audio_f32)
+
+    def predict_from_ring(self, ring: np.ndarray, write_idx: int, n_valid: int) -> dict:
+        """
+        Predict end-of-turn on the newest audio in a circular buffer.
+
+        Args:
+            ring:      16 kHz mono float32 ring buffer.
+            write_idx: index the next sample will be written to (one past newest).
+            n_valid:   number of valid samples written so far (may exceed len(ring)).
 
-        features = inputs.input_features.squeeze(0).astype(np.float32)
-        features = np.expand_dims(features, axis=0)  # batch dim
+        Same return value as predict(); avoids concatenating the turn first.
+        """
+        with self._lock:
+            out = self._audio_buf
+            n = min(n_valid, len(ring), len(out))
+            out[:len(out) - n] = 0.0
+            start = (write_idx - n) % len(ring)
+            k = min(n, len(ring) - start)          # contiguous run before wrap
+            dst = len(out) - n
+            out[dst:dst + k] = ring[start:start + k]
+            out[dst + k:] = ring[:n - k]
+            return self._infer()
+
+    def _infer(self) -> dict:
+        # Extract Whisper features straight into the bound input buffer
+        self._log_mel(self._audio_buf)
 
         # ONNX inference
         t0 = time.perf_counter()
-        outputs = self.session.run(None, {"input_features": features})
+        self.session.run_with_iobinding(self._io)
         dt_ms = (time.perf_counter() - t0) * 1000.0
 
-        probability = float(outputs[0][0].item())
+        probability = float(self._prob.flat[0])
         prediction = 1 if probability > 0.5 else 0
 
         log.debug(
@@ -185,21 +291,102 @@ class SmartTurnInference:
             "inference_ms": round(dt_ms, 2),
         }
 
+    def _log_mel(self, audio: np.ndarray) -> None:
+        """
+        Whisper log-mel spectrogram of exactly MAX_TURN_SECS of audio,
+        written into self._features.  Same steps as WhisperFeatureExtractor
+        with do_normalize=True: zero-mean/unit-var, centred reflect-padded
+        STFT (periodic Hann), power → mel → log10, clamp to max−8, rescale.
+        """
+        pad = N_FFT // 2
+        x = self._padded
+        body = x[pad:-pad]
+        np.subtract(audio, audio.mean(), out=body)
+        body /= np.sqrt(audio.var() + 1e-7)
+        x[:pad] = body[pad:0:-1]
+        x[-pad:] = body[-2:-pad - 2:-1]
+
+        frames = np.lib.stride_tricks.sliding_window_view(x, N_FFT)[::HOP_LENGTH]
+        spec = np.fft.rfft(frames[:N_FRAMES] * self._window, n=N_FFT)
+        power = np.square(spec.real, dtype=np.float32)
+        power += np.square(spec.imag, dtype=np.float32)
+
+        mel = self._features[0]
+        np.matmul(self._mel_fb, power.T, out=mel)
+        np.maximum(mel, 1e-10, out=mel)
+        np.log10(mel, out=mel)
+        np.maximum(mel, mel.max() - 8.0, out=mel)
+        mel += 4.0
+        mel /= 4.0
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  UTILITIES
 # ═════════════════════════════════════════════════════════════════════════════
-def _truncate_or_pad(
-    audio: np.ndarray, n_seconds: int = MAX_TURN_SECS
-) -> np.ndarray:
-    """Truncate to last n_seconds or zero-pad at the beginning."""
-    max_samples = n_seconds * SAMPLE_RATE
-    if len(audio) > max_samples:
-        return audio[-max_samples:]
-    elif len(audio) < max_samples:
-        padding = max_samples - len(audio)
-        return np.pad(audio, (padding, 0), mode="constant", constant_values=0)
-    return audio
+def _truncate_or_pad(audio: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Copy the last len(out) samples of audio into out, zero-padding at the beginning."""
+    max_samples = len(out)
+    n = min(len(audio), max_samples)
+    out[:max_samples - n] = 0.0
+    out[max_samples - n:] = audio[len(audio) - n:]
+    return out
+
+
+def _mel_filter_bank(n_mels: int) -> np.ndarray:
+    """Slaney-style mel filterbank (n_mels, N_FFT//2 + 1), 0–8 kHz, as Whisper uses."""
+    f_sp, min_log_hz = 200.0 / 3, 1000.0
+    min_log_mel, logstep = min_log_hz / f_sp, np.log(6.4) / 27.0
+
+    def hz_to_mel(f):
+        f = np.asarray(f, dtype=np.float64)
+        return np.where(f >= min_log_hz,
+                        min_log_mel + np.log(np.maximum(f, min_log_hz) / min_log_hz) / logstep,
+                        f / f_sp)
+
+    def mel_to_hz(m):
+        return np.where(m >= min_log_mel,
+                        min_log_hz * np.exp(logstep * (m - min_log_mel)),
+                        f_sp * m)
+
+    fft_freqs = np.linspace(0, SAMPLE_RATE / 2, N_FFT // 2 + 1)
+    mel_f = mel_to_hz(np.linspace(hz_to_mel(0.0), hz_to_mel(SAMPLE_RATE / 2), n_mels + 2))
+    fdiff = np.diff(mel_f)
+    ramps = mel_f[:, None] - fft_freqs[None, :]
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0.0, np.minimum(lower, upper))
+    weights *= (2.0 / (mel_f[2:] - mel_f[:-2]))[:, None]
+    return weights.astype(np.float32)
+
+
+def _int8_model(path: Path) -> Path:
+    """
+    Return an INT8 variant of an ONNX model, quantizing once to
+    <name>.int8.onnx next to it.  Models that already carry quantize ops
+    (the published smart-turn-*-cpu.onnx is QDQ int8) are returned as-is,
+    as is the original whenever quantization tooling is unavailable.
+    """
+    if path.name.endswith(".int8.onnx"):
+        return path
+    q_path = path.with_suffix(".int8.onnx")
+    if q_path.exists():
+        return q_path
+    if b"QuantizeLinear" in path.read_bytes():
+        return path
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(str(path), str(q_path), weight_type=QuantType.QInt8)
+    except Exception as exc:
+        log.warning("INT8 quantization skipped for %s (%s)", path.name, exc)
+        q_path.unlink(missing_ok=True)
+        return path
+    log.info("Quantized %s → %s  ✓", path.name, q_path.name)
+    return q_path
+
+
+def _static_shape(shape) -> tuple[int, ...]:
+    """ORT output shape with symbolic (batch) dims pinned to 1."""
+    return tuple(d if isinstance(d, int) else 1 for d in shape)
 
 
 def _ensure_model(path: Path, url: str) -> Path:
@@ -2,14 +2,15 @@
 Speech Client v5 — Silero VAD + Smart Turn v3 + NVIDIA Parakeet ASR
 ───────────────────────────────────────────────────────────────────
 LOCAL  : Silero VAD (neural VAD) + Smart Turn v3.2 (ML end-of-turn)
-API    : NVIDIA NIM Parakeet ASR via gRPC (only called on confirmed EOR)
+API    : NVIDIA NIM Parakeet ASR via gRPC (streamed per turn, final on EOR)
 Audio  : sounddevice 16 kHz mono
 
 Pipeline:
   Mic → 512-sample chunks → Silero VAD (LOCAL, speech probability)
-       → Speech? Accumulate full turn audio
+       → Speech? Accumulate full turn audio, stream it to Parakeet ASR
        → Silence? → Smart Turn v3 (LOCAL, EOR decision)
-       → EOR confirmed? → gRPC call → NVIDIA Parakeet ASR (API)
+       → EOR confirmed? → close stream → final transcript (offline call
+         on the buffered turn if the stream failed)
        → Transcript → WebSocket event + HTTP POST
 
 Events streamed to  ws://host:8000/ws/speech
@@ -19,13 +20,15 @@ Final transcripts   POST → http://host:8000/api/speech
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
 import math
 import os
+import queue
+import random
 import sys
+import threading
 import time
-import uuid
-from collections import deque
 from datetime import datetime, timezone
 
 import numpy as np
@@ -34,12 +37,19 @@ import sounddevice as sd
 import websockets
 import httpx
 
+try:
+    from numba import njit as _njit
+except ImportError:  # numba is optional — kernels run as plain NumPy
+    def _njit(*_args, **_kwargs):
+        return lambda fn: fn
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  CONFIGURATION
 # ═════════════════════════════════════════════════════════════════════════════
 WS_URL           = "ws://localhost:8000/ws/speech"
 API_URL          = "http://localhost:8000/api/speech"
 RECONNECT_DELAY  = 2.0
+JSON_HEADERS     = {"content-type": "application/json"}
 
 # ── NVIDIA Parakeet ASR (gRPC cloud API) ────────────────────────────────
 NVIDIA_API_KEY   = os.getenv("NVIDIA_API_KEY", "")
@@ -49,6 +59,10 @@ NVIDIA_FUNC_ID   = os.getenv(
     "1598d209-5e27-4d3c-8079-4751568b1081",  # parakeet-ctc-1.1b-asr
 )
 NVIDIA_ASR_LANG  = os.getenv("NVIDIA_ASR_LANG", "en-US")
+# Stream audio to ASR while the user is still speaking (offline call is the
+# fallback); set NVIDIA_ASR_STREAMING=0 for one offline call per turn.
+NVIDIA_ASR_STREAMING = os.getenv("NVIDIA_ASR_STREAMING", "1") != "0"
+STREAM_PUSH_SAMPLES  = 1_600       # send audio to the stream every 100 ms
 
 # ── Audio settings ──────────────────────────────────────────────────────
 SAMPLE_RATE      = 16_000          # Silero & Smart Turn expect 16 kHz
@@ -57,6 +71,8 @@ CHUNK_SIZE       = 512             # Silero VAD native chunk size at 16 kHz
 
 # ── Silero VAD settings ────────────────────────────────────────────────
 VAD_THRESHOLD    = 0.5             # speech probability threshold
+# (Silero's sigmoid is inside the ONNX graph, so thresholding the
+#  probability costs nothing extra — there is no logit to compare.)
 PRE_SPEECH_MS    = 200             # ms of audio to keep before speech trigger
 PRE_SPEECH_CHUNKS = math.ceil(PRE_SPEECH_MS / ((CHUNK_SIZE / SAMPLE_RATE) * 1000))
 
@@ -68,6 +84,15 @@ HARD_SILENCE_SECS       = 3.0      # force EOR after this much silence
 HARD_SILENCE_CHUNKS     = math.ceil(HARD_SILENCE_SECS / (CHUNK_SIZE / SAMPLE_RATE))
 MAX_TURN_SECS           = 8        # Smart Turn max input length
 MIN_SPEECH_SECS         = 0.3      # ignore bursts shorter than this
+KEEP_TRAILING_SECS      = 0.2      # silence kept after the last speech chunk
+KEEP_TRAILING_SAMPLES   = int(SAMPLE_RATE * KEEP_TRAILING_SECS)
+VAD_BATCH_MAX           = 8        # chunks drained per wakeup when catching up
+AUDIO_QUEUE_MAX         = HARD_SILENCE_CHUNKS * 4   # ~12 s of backlog before dropping
+
+# ── Energy gate (skips Smart Turn while the "silence" is still loud) ───
+NOISE_FLOOR_ALPHA       = 0.01     # EMA weight of non-speech chunks in the noise floor
+ENERGY_SMOOTH_ALPHA     = 0.3      # EMA weight for the short-term level
+ENERGY_GATE_RATIO       = 1.5      # run Smart Turn only below floor × this
 
 # ── Logging ─────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -79,13 +104,29 @@ log = logging.getLogger("speech-client")
 
 
 # ═════════════════════════════════════════════════════════════════════════════
-#  NVIDIA PARAKEET ASR — gRPC CLIENT (one-shot offline recognition)
+#  NVIDIA PARAKEET ASR — gRPC CLIENT (per-turn streaming, offline fallback)
 # ═════════════════════════════════════════════════════════════════════════════
 _riva_asr = None  # lazy-loaded riva.client.ASRService
+_riva_config = None  # RecognitionConfig, built once with the client
+_riva_streaming_config = None  # StreamingRecognitionConfig wrapping it
+
+# int16 staging buffer for the PCM conversion, reused across turns
+# (grown if a turn runs past MAX_TURN_SECS).
+_pcm_scratch = np.empty(SAMPLE_RATE * MAX_TURN_SECS, dtype=np.int16)
+_pcm_lock = threading.Lock()
+
+# Keep the HTTP/2 connection warm between turns so an utterance after a
+# long pause doesn't pay for a fresh TLS handshake.
+GRPC_KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
 
 def _get_riva_asr():
     """Lazy-init the Riva gRPC ASR client (only once)."""
-    global _riva_asr
+    global _riva_asr, _riva_config, _riva_streaming_config
     if _riva_asr is not None:
         return _riva_asr
 
@@ -99,12 +140,28 @@ def _get_riva_asr():
         ("authorization", f"Bearer {NVIDIA_API_KEY}"),
     ]
 
-    auth = riva.client.Auth(
+    auth_kwargs = dict(
         ssl_root_cert=None,
         use_ssl=True,
         uri=NVIDIA_ASR_URL,
         metadata_args=metadata,
     )
+    try:
+        auth = riva.client.Auth(**auth_kwargs, options=GRPC_KEEPALIVE_OPTIONS)
+    except TypeError:
+        # Older riva clients don't take channel options
+        auth = riva.client.Auth(**auth_kwargs)
+    _riva_config = riva.client.RecognitionConfig(
+        encoding=riva.client.AudioEncoding.LINEAR_PCM,
+        sample_rate_hertz=SAMPLE_RATE,
+        language_code=NVIDIA_ASR_LANG,
+        max_alternatives=1,
+        enable_automatic_punctuation=True,
+        audio_channel_count=1,
+    )
+    _riva_streaming_config = riva.client.StreamingRecognitionConfig(
+        config=_riva_config, interim_results=False,
+    )
     _riva_asr = riva.client.ASRService(auth)
     log.info("NVIDIA Parakeet ASR client ready  ✓")
     return _riva_asr
@@ -115,33 +172,28 @@ def transcribe_nvidia_sync(audio_f32: np.ndarray) -> dict:
     Send audio to NVIDIA Parakeet ASR via gRPC and return transcript.
 
     Args:
-        audio_f32: 16 kHz mono float32 audio array
+        audio_f32: 16 kHz mono float32 audio array (clipped in place)
 
     Returns:
         {'text': str, 'confidence': float, 'language': str}
     """
-    import riva.client
-
     asr = _get_riva_asr()
 
-    # Convert float32 → 16-bit PCM bytes (Riva expects LINEAR16 raw bytes)
-    audio_int16 = np.clip(audio_f32, -1.0, 1.0)
-    audio_int16 = (audio_int16 * 32767).astype(np.int16)
-    audio_bytes = audio_int16.tobytes()
-
-    # Build recognition config
-    config = riva.client.RecognitionConfig(
-        encoding=riva.client.AudioEncoding.LINEAR_PCM,
-        sample_rate_hertz=SAMPLE_RATE,
-        language_code=NVIDIA_ASR_LANG,
-        max_alternatives=1,
-        enable_automatic_punctuation=True,
-        audio_channel_count=1,
-    )
+    # Convert float32 → 16-bit PCM bytes (Riva expects LINEAR16 raw bytes).
+    # Clip in place, then scale straight into the shared int16 scratch —
+    # no float temporaries, and the only per-turn allocation is the bytes.
+    global _pcm_scratch
+    np.clip(audio_f32, -1.0, 1.0, out=audio_f32)
+    with _pcm_lock:
+        if len(_pcm_scratch) < len(audio_f32):
+            _pcm_scratch = np.empty(len(audio_f32), dtype=np.int16)
+        audio_int16 = _pcm_scratch[:len(audio_f32)]
+        np.multiply(audio_f32, 32767.0, out=audio_int16, casting="unsafe")
+        audio_bytes = audio_int16.tobytes()
 
     t0 = time.perf_counter()
     try:
-        response = asr.offline_recognize(audio_bytes, config)
+        response = asr.offline_recognize(audio_bytes, _riva_config)
         dt_ms = (time.perf_counter() - t0) * 1000.0
 
         # Parse response
@@ -170,9 +222,121 @@ def transcribe_nvidia_sync(audio_f32: np.ndarray) -> dict:
         return {"text": "", "confidence": 0.0, "language": NVIDIA_ASR_LANG}
 
 
+class StreamingTurn:
+    """
+    One streaming-recognition RPC spanning a single speech turn.
+
+    Audio is pushed from the event loop as the turn grows, so by the time
+    Smart Turn calls end-of-turn the server has already decoded nearly all
+    of it.  The RPC runs on the ASR executor; finish() half-closes the
+    stream and returns a future for the transcript dict, or for None if
+    the stream failed (the caller then falls back to an offline call).
+    """
+
+    def __init__(self, pool: concurrent.futures.Executor):
+        self._q: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._pending: list[np.ndarray] = []
+        self._pending_len = 0
+        self._future = pool.submit(self._run)
+
+    def push(self, audio_f32: np.ndarray) -> None:
+        """Queue audio (not retained); flushed to the RPC every ~100 ms."""
+        self._pending.append(np.clip(audio_f32, -1.0, 1.0))
+        self._pending_len += len(audio_f32)
+        if self._pending_len >= STREAM_PUSH_SAMPLES:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        pcm = np.empty(self._pending_len, dtype=np.int16)
+        np.multiply(np.concatenate(self._pending), 32767.0, out=pcm, casting="unsafe")
+        self._q.put(pcm.tobytes())
+        self._pending.clear()
+        self._pending_len = 0
+
+    def finish(self) -> concurrent.futures.Future:
+        self._flush()
+        self._q.put(None)
+        return self._future
+
+    def cancel(self) -> None:
+        """Close the stream without flushing; the result is ignored."""
+        self._pending.clear()
+        self._q.put(None)
+
+    def _chunks(self):
+        while (data := self._q.get()) is not None:
+            yield data
+
+    def _run(self) -> dict | None:
+        asr = _get_riva_asr()
+        t0 = time.perf_counter()
+        text = ""
+        confidence = 0.0
+        try:
+            for response in asr.streaming_response_generator(
+                audio_chunks=self._chunks(), streaming_config=_riva_streaming_config,
+            ):
+                for result in response.results:
+                    if result.is_final and result.alternatives:
+                        alt = result.alternatives[0]
+                        text += alt.transcript
+                        confidence = max(confidence, alt.confidence)
+        except Exception as exc:
+            # push()/finish() only put() on an unbounded queue, so the
+            # loop never blocks on a dead stream
+            log.warning("NVIDIA ASR stream failed: %s — falling back to offline", exc)
+            return None
+
+        # Time from the last audio push to the final result ≈ turn latency
+        dt_ms = (time.perf_counter() - t0) * 1000.0
+        text = text.strip()
+        log.info('📝  NVIDIA ASR (stream): "%s"  (%.0f ms open, conf=%.2f)',
+                 text, dt_ms, confidence)
+        return {"text": text, "confidence": confidence, "language": NVIDIA_ASR_LANG}
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  EVENT BUILDER
 # ═════════════════════════════════════════════════════════════════════════════
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_iso_now() -> str:
+    """
+    UTC ISO-8601 timestamp with microseconds, same shape as
+    datetime.isoformat(); the date/time part is formatted once per second.
+    """
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return f"{_ts_cache[1]}.{ns // 1000:06d}+00:00"
+
+
+def _event_id() -> str:
+    return f"evt_{random.getrandbits(48):012x}"
+
+
+# Status events never vary below "speech", so that part is serialized once;
+# only event_id and timestamp are spliced in per event.
+_STATUS_BODIES = {
+    state: orjson.dumps({
+        "type":  "status",
+        "state": state,
+        "data": {"text": "", "confidence": 0.0, "duration_ms": 0.0, "language": ""},
+    })
+    for state in ("listening", "speaking")
+}
+
+
+def status_event_bytes(state: str) -> bytes:
+    return (b'{"event_id":"' + _event_id().encode()
+            + b'","timestamp":"' + _utc_iso_now().encode()
+            + b'","speech":' + _STATUS_BODIES[state] + b"}")
+
+
 def make_event(
     event_type: str,
     state: str,
@@ -182,8 +346,8 @@ def make_event(
     language: str = "",
 ) -> dict:
     return {
-        "event_id":  f"evt_{uuid.uuid4().hex[:12]}",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "event_id":  _event_id(),
+        "timestamp": _utc_iso_now(),
         "speech": {
             "type":  event_type,
             "state": state,
@@ -197,6 +361,22 @@ def make_event(
     }
 
 
+# ═════════════════════════════════════════════════════════════════════════════
+#  PER-CHUNK KERNEL
+# ═════════════════════════════════════════════════════════════════════════════
+@_njit(cache=True, fastmath=True)
+def _energy_step(chunk, scratch, level, floor, is_speech):
+    """
+    Mean |x| of one chunk folded into the short-term level and (on
+    non-speech chunks) the noise-floor EMAs.  Returns (level, floor).
+    """
+    mabs = np.abs(chunk, scratch).mean()
+    level += ENERGY_SMOOTH_ALPHA * (mabs - level)
+    if not is_speech:
+        floor = mabs if floor == 0.0 else floor + NOISE_FLOOR_ALPHA * (mabs - floor)
+    return level, floor
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 #  SPEECH ENGINE — Silero VAD + Smart Turn EOR (all local)
 # ═════════════════════════════════════════════════════════════════════════════
@@ -219,14 +399,48 @@ class SpeechEngine:
 
         # State
         self.speech_active = False
-        self.speech_start = 0.0
         self.trailing_silence = 0
-        self.since_trigger = 0
+        self.since_trigger = 0          # chunks since speech start → turn duration
         self.smart_turn_pending = False
-
-        # Audio buffers
-        self._pre_buffer: deque[np.ndarray] = deque(maxlen=PRE_SPEECH_CHUNKS)
-        self._turn_chunks: list[np.ndarray] = []
+        self.noise_floor = 0.0          # mean |x| of background, 0 = not learned yet
+        self.level = 0.0                # short-term mean |x|
+
+        # Audio buffers — pre-roll is a flat ring of PRE_SPEECH_CHUNKS chunk
+        # slots; the turn is appended into one float32 buffer sized for a
+        # full Smart Turn window plus pre-roll, which doubles if a turn runs
+        # longer.  Both are reused across turns.
+        self._pre_ring = np.empty(PRE_SPEECH_CHUNKS * CHUNK_SIZE, dtype=np.float32)
+        self._pre_pos = 0               # next slot to write
+        self._pre_count = 0             # filled slots
+        self._abs_scratch = np.empty(CHUNK_SIZE, dtype=np.float32)
+        self._turn_buf = np.empty(
+            SAMPLE_RATE * MAX_TURN_SECS + PRE_SPEECH_CHUNKS * CHUNK_SIZE, dtype=np.float32,
+        )
+        self._turn_len = 0
+
+    @property
+    def turn_audio(self) -> np.ndarray:
+        """View of the current turn's audio (valid until the next feed)."""
+        return self._turn_buf[:self._turn_len]
+
+    def _append_turn(self, chunk: np.ndarray) -> None:
+        n = self._turn_len
+        if n + len(chunk) > len(self._turn_buf):
+            grown = np.empty(2 * len(self._turn_buf), dtype=np.float32)
+            grown[:n] = self._turn_buf[:n]
+            self._turn_buf = grown
+        self._turn_buf[n:n + len(chunk)] = chunk
+        self._turn_len = n + len(chunk)
+
+    def _flush_pre_roll(self) -> None:
+        """Start the turn with the pre-roll ring, oldest first (≤ 2 copies)."""
+        ring = self._pre_ring
+        k = self._pre_count * CHUNK_SIZE
+        head = (self._pre_pos - self._pre_count) % PRE_SPEECH_CHUNKS * CHUNK_SIZE
+        first = min(k, len(ring) - head)
+        self._turn_buf[:first] = ring[head:head + first]
+        self._turn_buf[first:k] = ring[:k - first]
+        self._turn_len = k
 
     def feed(self, chunk: np.ndarray) -> tuple[str, np.ndarray | None]:
         """
@@ -239,20 +453,35 @@ class SpeechEngine:
             - ("skip", None)       → too short, skipped
             - ("", None)           → nothing interesting
         """
-        speech_prob = self.vad.prob(chunk)
-        is_speech = speech_prob > VAD_THRESHOLD
+        return self.feed_with_prob(chunk, self.vad.prob(chunk))
+
+    def feed_with_prob(
+        self, chunk: np.ndarray, speech_prob: float, *,
+        # Bound at def time: runs ~31×/s, so these are fast local lookups
+        _energy=_energy_step, _chunk_secs=CHUNK_SIZE / SAMPLE_RATE,
+        _vad_thresh=VAD_THRESHOLD, _gate=ENERGY_GATE_RATIO,
+        _hard=HARD_SILENCE_CHUNKS, _stop=SMART_TURN_STOP_CHUNKS,
+    ) -> tuple[str, np.ndarray | None]:
+        """Like feed(), with the VAD probability for this chunk already computed."""
+        is_speech = speech_prob > _vad_thresh
+
+        level, floor = _energy(chunk, self._abs_scratch, self.level, self.noise_floor, is_speech)
+        self.level = level = float(level)
+        self.noise_floor = floor = float(floor)
 
         if not self.speech_active:
-            self._pre_buffer.append(chunk.copy())
+            off = self._pre_pos * CHUNK_SIZE
+            self._pre_ring[off:off + CHUNK_SIZE] = chunk
+            self._pre_pos = (self._pre_pos + 1) % PRE_SPEECH_CHUNKS
+            if self._pre_count < PRE_SPEECH_CHUNKS:
+                self._pre_count += 1
 
             if is_speech:
                 self.speech_active = True
-                self.speech_start = time.monotonic()
                 self.trailing_silence = 0
                 self.since_trigger = 0
                 self.smart_turn_pending = False
-                self._turn_chunks = list(self._pre_buffer)
-                self._turn_chunks.append(chunk.copy())
+                self._flush_pre_roll()          # includes this chunk
                 self.since_trigger = 1
                 log.info("🎙  Speech started (vad_prob=%.3f)", speech_prob)
                 return ("speaking", None)
@@ -260,7 +489,7 @@ class SpeechEngine:
             return ("", None)
 
         # Currently in a speech turn
-        self._turn_chunks.append(chunk.copy())
+        self._append_turn(chunk)
         self.since_trigger += 1
 
         if is_speech:
@@ -270,18 +499,22 @@ class SpeechEngine:
             self.trailing_silence += 1
 
         # Hard silence fallback
-        if self.trailing_silence >= HARD_SILENCE_CHUNKS:
+        if self.trailing_silence >= _hard:
             log.info(
                 "⏹  Hard silence EOR (%.1fs silence)",
                 self.trailing_silence * CHUNK_SIZE / SAMPLE_RATE,
             )
             return self._end_turn()
 
-        # Smart Turn check
-        if self.trailing_silence >= SMART_TURN_STOP_CHUNKS and not self.smart_turn_pending:
+        # Smart Turn check — held back while the trailing "silence" is still
+        # well above the noise floor (breath, trailing syllable); hard
+        # silence above still bounds the wait.
+        quiet = level < floor * _gate or floor == 0.0
+        if (self.trailing_silence >= _stop
+                and not self.smart_turn_pending and quiet):
             self.smart_turn_pending = True
-            turn_audio = np.concatenate(self._turn_chunks).astype(np.float32)
-            speech_dur = time.monotonic() - self.speech_start
+            turn_audio = self._turn_buf[:self._turn_len]   # view; predict() copies
+            speech_dur = self.since_trigger * _chunk_secs   # audio time, not wall clock
 
             if speech_dur < MIN_SPEECH_SECS:
                 return ("", None)
@@ -309,7 +542,7 @@ class SpeechEngine:
 
     def _end_turn(self) -> tuple[str, np.ndarray | None]:
         """Finalize turn: return audio for API transcription."""
-        speech_dur = time.monotonic() - self.speech_start
+        speech_dur = self.since_trigger * CHUNK_SIZE / SAMPLE_RATE
         self.speech_active = False
         trailing = self.trailing_silence
         self.trailing_silence = 0
@@ -318,8 +551,8 @@ class SpeechEngine:
 
         if speech_dur < MIN_SPEECH_SECS:
             log.info("⚡  Too short (%.0f ms), skipping", speech_dur * 1000)
-            self._turn_chunks.clear()
-            self._pre_buffer.clear()
+            self._turn_len = 0
+            self._pre_count = 0
             self.vad.reset()
             return ("skip", None)
 
@@ -328,16 +561,20 @@ class SpeechEngine:
             speech_dur,
         )
 
-        audio = np.concatenate(self._turn_chunks).astype(np.float32)
-        self._turn_chunks.clear()
+        # Trim trailing silence — keep only KEEP_TRAILING_SECS after last
+        # speech.  Only the length shrinks; the dropped tail is never copied.
+        n = self._turn_len
+        trim_samples = max(0, trailing * CHUNK_SIZE - KEEP_TRAILING_SAMPLES)
+        if 0 < trim_samples < n:
+            n -= trim_samples
 
-        # Trim trailing silence — keep only 0.2s after last speech
-        trim_samples = max(0, int(trailing * CHUNK_SIZE) - int(SAMPLE_RATE * 0.2))
-        if trim_samples > 0 and len(audio) > trim_samples:
-            audio = audio[:-trim_samples]
+        # Single copy at hand-off: the buffer is reused by the next turn
+        # while ASR runs (and transcribe clips its input in place)
+        audio = self._turn_buf[:n].copy()
+        self._turn_len = 0
 
         self.vad.reset()
-        self._pre_buffer.clear()
+        self._pre_count = 0
 
         return ("eor", audio)
 
@@ -355,8 +592,12 @@ async def run():
         )
         sys.exit(1)
 
-    # ── Pre-connect NVIDIA ASR (lazy, but warm up now) ───────────────
-    _get_riva_asr()
+    # ── Dedicated ASR thread — keeps gRPC calls serialized and off the
+    #    default executor; pre-connect NVIDIA ASR on it now ───────────
+    asr_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="asr",
+    )
+    asr_pool.submit(_get_riva_asr).result()
 
     # ── WebSocket connection ─────────────────────────────────────────
     ws = None
@@ -388,17 +629,59 @@ async def run():
 
     await connect_ws()
 
-    # ── HTTP client for server API ───────────────────────────────────
-    http = httpx.AsyncClient(timeout=30.0)
-
-    # ── Audio queue ──────────────────────────────────────────────────
-    audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
+    # ── HTTP client for server API (kept-alive, reused per POST) ─────
+    # Plain HTTP/1.1: the API is http:// on uvicorn, which has no h2c.
+    http = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+    )
+    posts: set[asyncio.Task] = set()
+
+    def _post_done(task: asyncio.Task):
+        posts.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.warning("API POST failed: %s", exc)
+        else:
+            log.info("📡  API POST → %d", task.result().status_code)
+
+    def post_transcript(data: dict):
+        """Fire-and-forget POST; the mic loop doesn't wait on the server."""
+        task = asyncio.create_task(http.post(
+            API_URL, content=orjson.dumps(data), headers=JSON_HEADERS,
+        ))
+        posts.add(task)
+        task.add_done_callback(_post_done)
+
+    # ── Audio queue (bounded; drops the oldest chunk if ASR stalls) ──
+    audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue(maxsize=AUDIO_QUEUE_MAX)
     loop = asyncio.get_event_loop()
+    dropped = 0
+    last_drop_log = 0.0
 
-    def audio_callback(indata, frames, time_info, status):
+    def enqueue(chunk: np.ndarray):
+        nonlocal dropped, last_drop_log
+        try:
+            audio_queue.put_nowait(chunk)
+            return
+        except asyncio.QueueFull:
+            audio_queue.get_nowait()
+            audio_queue.put_nowait(chunk)
+        dropped += 1
+        now = time.monotonic()
+        if now - last_drop_log >= 5.0:
+            log.warning("Audio queue full — dropped %d oldest chunk(s)", dropped)
+            dropped = 0
+            last_drop_log = now
+
+    def audio_callback(indata, frames, time_info, status,
+                       _post=loop.call_soon_threadsafe, _enqueue=enqueue):
         if status:
             log.warning("Audio: %s", status)
-        loop.call_soon_threadsafe(audio_queue.put_nowait, indata[:, 0].copy())
+        # Mono and C-contiguous: ravel() is a view, so this is one flat memcpy
+        _post(_enqueue, indata.ravel().copy())
 
     stream = sd.InputStream(
         samplerate=SAMPLE_RATE,
@@ -432,61 +715,91 @@ async def run():
                 pass
 
     # ── Ready ────────────────────────────────────────────────────────
-    await ws_send(orjson.dumps(make_event("status", "listening")))
+    await ws_send(status_event_bytes("listening"))
     log.info("✅  Ready — start speaking!")
     log.info("    VAD      : Silero (local)")
     log.info("    EOR      : Smart Turn v3 (local)")
     log.info("    ASR      : NVIDIA Parakeet (gRPC → %s)", NVIDIA_ASR_URL)
 
-    # ── Main recognition loop ────────────────────────────────────────
-    try:
-        while True:
-            chunk = await audio_queue.get()
-            event_type, audio = engine.feed(chunk)
+    # ── Per-event handling ───────────────────────────────────────────
+    asr_stream: StreamingTurn | None = None     # open while a turn is live
+
+    async def handle_event(event_type: str, audio: np.ndarray | None):
+        nonlocal asr_stream
+        if event_type == "speaking":
+            if NVIDIA_ASR_STREAMING:
+                asr_stream = StreamingTurn(asr_pool)
+                asr_stream.push(engine.turn_audio)      # pre-roll + first chunk
+            await ws_send(status_event_bytes("speaking"))
+
+        elif event_type == "skip":
+            if asr_stream is not None:
+                asr_stream.cancel()
+                asr_stream = None
+            await ws_send(status_event_bytes("listening"))
+
+        elif event_type == "eor" and audio is not None:
+            # ═══ API CALL — run gRPC in a thread to avoid blocking ═══
+            speech_dur = len(audio) / SAMPLE_RATE
+            result = None
+            if asr_stream is not None:
+                result = await asyncio.wrap_future(asr_stream.finish())
+                asr_stream = None
+            if result is None:
+                result = await loop.run_in_executor(
+                    asr_pool, transcribe_nvidia_sync, audio
+                )
+            text = result["text"]
+
+            if text:
+                event = make_event(
+                    "transcript", "final",
+                    text=text,
+                    confidence=result["confidence"],
+                    duration_ms=speech_dur * 1000,
+                    language=result["language"],
+                )
+                raw = orjson.dumps(event)
+                await ws_send(raw)
 
-            if event_type == "speaking":
-                await ws_send(orjson.dumps(make_event("status", "speaking")))
+                # POST to local server API
+                post_transcript(event["speech"]["data"])
+            else:
+                log.info("📝  Empty transcript, skipping")
 
-            elif event_type == "skip":
-                await ws_send(orjson.dumps(make_event("status", "listening")))
+            # Back to listening
+            await ws_send(status_event_bytes("listening"))
+            log.info("👂  Listening …")
 
-            elif event_type == "eor" and audio is not None:
-                # ═══ API CALL — run gRPC in a thread to avoid blocking ═══
-                speech_dur = len(audio) / SAMPLE_RATE
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, transcribe_nvidia_sync, audio
-                )
-                text = result["text"]
-
-                if text:
-                    event = make_event(
-                        "transcript", "final",
-                        text=text,
-                        confidence=result["confidence"],
-                        duration_ms=speech_dur * 1000,
-                        language=result["language"],
-                    )
-                    raw = orjson.dumps(event)
-                    await ws_send(raw)
-
-                    # POST to local server API
-                    try:
-                        resp = await http.post(API_URL, json=event["speech"]["data"])
-                        log.info("📡  API POST → %d", resp.status_code)
-                    except Exception as exc:
-                        log.warning("API POST failed: %s", exc)
+    # ── Main recognition loop ────────────────────────────────────────
+    # Normally one chunk per wakeup; after a slow ASR call the backlog is
+    # drained up to VAD_BATCH_MAX chunks at a time and scored in one go.
+    try:
+        while True:
+            chunks = [await audio_queue.get()]
+            while len(chunks) < VAD_BATCH_MAX and not audio_queue.empty():
+                chunks.append(audio_queue.get_nowait())
+            probs = engine.vad.prob_batch(chunks)
+
+            rescore = False     # VAD was reset mid-batch → later probs are stale
+            for chunk, prob in zip(chunks, probs):
+                if rescore:
+                    event_type, audio = engine.feed(chunk)
                 else:
-                    log.info("📝  Empty transcript, skipping")
-
-                # Back to listening
-                await ws_send(orjson.dumps(make_event("status", "listening")))
-                log.info("👂  Listening …")
+                    event_type, audio = engine.feed_with_prob(chunk, float(prob))
+                    rescore = event_type in ("eor", "skip")
+                if event_type:
+                    await handle_event(event_type, audio)
+                elif asr_stream is not None and engine.speech_active:
+                    asr_stream.push(chunk)
 
     except KeyboardInterrupt:
         log.info("Interrupted by user")
     finally:
         stream.stop()
         stream.close()
+        if asr_stream is not None:
+            asr_stream.cancel()
         if drain and not drain.done():
             drain.cancel()
         if ws:
@@ -494,7 +807,10 @@ async def run():
                 await ws.close()
             except Exception:
                 pass
+        if posts:
+            await asyncio.gather(*posts, return_exceptions=True)
         await http.aclose()
+        asr_pool.shutdown(wait=False)
         log.info("Done.")
 
 
@@ -5,7 +5,12 @@ Also provides continuous cursor tracking so the OS mouse follows the hand.
 """
 
 import logging
+import math
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Optional
 
 import pyautogui
@@ -13,16 +18,93 @@ import pyautogui
 from tools.base import BaseTool, ToolResult, ToolResultStatus
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
+try:
+    from numba import njit as _njit
+except ImportError:  # numba is optional — the cursor kernel runs as plain Python
+    def _njit(*_args, **_kwargs):
+        return lambda fn: fn
+
 # Disable pyautogui fail-safe for fluid cursor tracking
 pyautogui.FAILSAFE = False
 pyautogui.PAUSE = 0
 
 log = logging.getLogger("gesture_handler")
 
+_EMPTY = MappingProxyType({})   # shared read-only default for missing sub-objects
+_ACTIVE_STATES = frozenset(("start", "active"))
+_END_STATES = frozenset(("end", "ended", ""))
+
+# Per-frame cursor moves go straight to user32.SetCursorPos (what pyautogui
+# calls underneath, minus its Point/fail-safe/pause bookkeeping).  The
+# function pointer is resolved once here; other platforms use pyautogui.
+if sys.platform == "win32":
+    import ctypes
+
+    _move_cursor = ctypes.windll.user32.SetCursorPos
+    _move_cursor.argtypes = (ctypes.c_int, ctypes.c_int)
+    _move_cursor.restype = ctypes.c_bool
+
+    def _boost_thread_priority():
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 1)  # ABOVE_NORMAL
+else:
+    def _move_cursor(px: int, py: int):
+        pyautogui.moveTo(px, py, duration=0, _pause=False)
+
+    def _boost_thread_priority():
+        pass
+
+
+# ── Cursor kernel ─────────────────────────────────────────────────────────
+# Remap, One Euro smoothing, clamp and pixel scaling for both axes in one
+# call per frame.  Plain scalars in/out so it compiles under numba when
+# available and runs unchanged as Python otherwise.
+@_njit(cache=True, fastmath=True)
+def _alpha(cutoff, dt):
+    return 1.0 / (1.0 + 1.0 / (2.0 * math.pi * cutoff * dt))
+
+
+@_njit(cache=True, fastmath=True)
+def _one_euro(raw, x, dx, dt, min_cutoff, beta, d_cutoff):
+    """
+    One Euro filter step (Casiez et al., CHI 2012): the low-pass cutoff
+    rises with the filtered speed, so a still hand is smoothed hard while
+    fast moves pass through with little lag.  Returns (x, dx).
+    """
+    dx += _alpha(d_cutoff, dt) * ((raw - x) / dt - dx)
+    x += _alpha(min_cutoff + beta * abs(dx), dt) * (raw - x)
+    return x, dx
+
+
+@_njit(cache=True, fastmath=True)
+def _cursor_step(rx, ry, x, dx, y, dy, dt, primed,
+                 margin, inv_range, min_cutoff, beta_x, beta_y, d_cutoff, w, h):
+    """
+    Raw normalised sample → target pixel.
+    Returns (x, dx, y, dy, px, py, settled): the new filter state, the
+    pixel, and whether that pixel is already the sample's own.  Each step
+    moves x toward the sample without overshooting, so once they share a
+    pixel, repeating the sample can't change it.
+    """
+    rx = (rx - margin) * inv_range
+    rx = 0.0 if rx < 0.0 else 1.0 if rx > 1.0 else rx
+    ry = (ry - margin) * inv_range
+    ry = 0.0 if ry < 0.0 else 1.0 if ry > 1.0 else ry
+    if primed:
+        x, dx = _one_euro(rx, x, dx, dt, min_cutoff, beta_x, d_cutoff)
+        y, dy = _one_euro(ry, y, dy, dt, min_cutoff, beta_y, d_cutoff)
+    else:
+        x, dx, y, dy = rx, 0.0, ry, 0.0
+    px = int(min(1.0, max(0.0, x)) * w)
+    py = int(min(1.0, max(0.0, y)) * h)
+    settled = px == int(rx * w) and py == int(ry * h)
+    return x, dx, y, dy, px, py, settled
+
 
 class GestureHandler:
     """
-    Receives parsed gesture event dicts (from the WebSocket stream)
+    Receives parsed gesture events (from the WebSocket stream) — plain
+    dicts, or ws_client's typed GestureEvent Structs when msgspec is present
     and dispatches the appropriate tool call on the shared BaseTool layers.
 
     Gesture → Action mapping:
@@ -33,19 +115,25 @@ class GestureHandler:
         pinch_flick    → scroll(direction from velocity)
     """
 
-    # Gesture types we handle
-    HANDLED_GESTURES = {"tap", "double_tap", "pinch_hold", "pinch_drag", "pinch_flick"}
+    # Gesture types we handle (dispatched by the match in handle_event)
+    HANDLED_GESTURES = frozenset(("tap", "double_tap", "pinch_hold", "pinch_drag", "pinch_flick"))
 
     # ── Cursor tuning ────────────────────────────────────────────────────
-    # EMA smoothing: 0.0 = frozen, 1.0 = raw (no smoothing).
-    # Lower values = smoother but laggier. 0.3-0.4 is a good balance.
-    SMOOTHING_FACTOR = 0.35
+    # One Euro smoothing.  MIN_CUTOFF (Hz) sets the jitter filtering when
+    # the hand is still (lower = smoother); BETA sets how quickly the
+    # cutoff opens up with speed (higher = less lag on fast moves).  BETA
+    # is given per pixel/s and scaled to normalised units per axis.
+    ONE_EURO_MIN_CUTOFF = 1.0
+    ONE_EURO_BETA_PX = 0.007
+    ONE_EURO_D_CUTOFF = 1.0
+    DEFAULT_FRAME_DT = 1 / 30     # used when two frames share a timestamp
 
     # Edge margin: how much of the normalised range near the edges to
     # discard and stretch.  0.08 means the usable hand area (0.08 – 0.92)
     # is remapped to the full screen (0.0 – 1.0) so you can comfortably
     # reach all four edges without extreme hand positions.
     EDGE_MARGIN = 0.08
+    _INV_RANGE = 1.0 / (1.0 - 2 * EDGE_MARGIN)   # remap scale, precomputed
     # ─────────────────────────────────────────────────────────────────────
 
     def __init__(self, tool_sets: list[BaseTool], screen_w: int = None, screen_h: int = None):
@@ -59,12 +147,29 @@ class GestureHandler:
             for defn in tool_set.get_definitions():
                 self._tools[defn.name] = tool_set
 
-        self._action_count = 0
-        self._last_cursor_log = 0.0  # Rate-limit cursor movement logging
+        # The gesture handlers' tools, resolved to their tool set's execute
+        # once here rather than looked up by name on every action
+        self._exec_click = self._bind_tool("click")
+        self._exec_drag_and_drop = self._bind_tool("drag_and_drop")
+        self._exec_scroll = self._bind_tool("scroll")
 
-        # Smoothed cursor state (initialised on first event)
-        self._smooth_x: Optional[float] = None
-        self._smooth_y: Optional[float] = None
+        self._action_count = 0
+        self._frame_ctr = 0  # Rate-limit cursor movement logging (every 256 moves)
+
+        # Smoothed cursor state: One Euro position + speed per axis
+        # (primed by the first sample)
+        self._sx = self._sdx = self._sy = self._sdy = 0.0
+        self._primed = False
+        self._beta_x = self.ONE_EURO_BETA_PX * self._screen_w
+        self._beta_y = self.ONE_EURO_BETA_PX * self._screen_h
+        self._last_sample_ns: Optional[int] = None
+        # Still-hand fast path: the last raw sample and its output pixel,
+        # reused while the same sample repeats and the filter has settled
+        self._raw_x = self._raw_y = -1.0
+        self._settled = False
+        self._track_px: tuple[int, int] = (0, 0)
+        self._last_px = -1
+        self._last_py = -1
 
         # Cursor freeze: lock position during active gestures to prevent
         # hand drift from moving the click target.
@@ -72,96 +177,163 @@ class GestureHandler:
         self._freeze_px: int = 0
         self._freeze_py: int = 0
 
+        # Cursor mover thread: the event callback only publishes the newest
+        # target pixel (a single tuple store) and wakes it; intermediate
+        # targets that arrive before it runs are simply overwritten.
+        self._latest_px: Optional[tuple[int, int]] = None
+        self._wake = threading.Event()
+        threading.Thread(target=self._mover_loop, name="cursor-mover", daemon=True).start()
+
+        # Gesture actions run on one worker thread so a drag (0.5 s) doesn't
+        # stall the event stream.  The cursor is held still until the newest
+        # queued action has finished, so no move lands in the middle of one.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gesture-tool")
+        self._inflight: Optional[Future] = None
+
+        # Make pyautogui's first user32 calls (function pointer lookups in
+        # its platform module) here rather than on the first gesture
+        pyautogui.position()
+
+        # Compile (or load the cached) numba kernel now, not on the first frame
+        _cursor_step(0.5, 0.5, 0.0, 0.0, 0.0, 0.0, self.DEFAULT_FRAME_DT, False,
+                     self.EDGE_MARGIN, self._INV_RANGE, 1.0, 1.0, 1.0, 1.0, 1, 1)
+
     # ── Public API ───────────────────────────────────────────────────────
 
-    def _remap_edge(self, v: float) -> float:
-        """Remap normalised value so the inner range fills the full screen."""
-        m = self.EDGE_MARGIN
-        return max(0.0, min(1.0, (v - m) / (1.0 - 2 * m)))
-
-    def _smooth(self, raw_x: float, raw_y: float) -> tuple[float, float]:
-        """Apply EMA smoothing to reduce jitter."""
-        a = self.SMOOTHING_FACTOR
-        if self._smooth_x is None:
-            # First frame — initialise to current position
-            self._smooth_x = raw_x
-            self._smooth_y = raw_y
-        else:
-            self._smooth_x = a * raw_x + (1 - a) * self._smooth_x
-            self._smooth_y = a * raw_y + (1 - a) * self._smooth_y
-        return self._smooth_x, self._smooth_y
+    def _track(self, cursor: dict, ts_ns) -> tuple[int, int]:
+        """
+        Run one raw cursor sample through the remap/smoothing kernel → pixel.
+        ts_ns is the event's capture timestamp (time.time_ns() on the
+        gesture client), so dt is the real spacing between camera frames
+        rather than network arrival jitter; the local clock is only read
+        for events that don't carry one.
+        """
+        if type(ts_ns) is not int:
+            ts_ns = time.time_ns()
+        last = self._last_sample_ns
+        dt = (ts_ns - last) * 1e-9 if last is not None and ts_ns > last else self.DEFAULT_FRAME_DT
+        self._last_sample_ns = ts_ns
+
+        get = cursor.get
+        rx = get("x")
+        if rx is None:
+            rx = 0.5
+        ry = get("y")
+        if ry is None:
+            ry = 0.5
+        if self._settled and rx == self._raw_x and ry == self._raw_y:
+            return self._track_px   # hand is still and the filter has caught up
+
+        (self._sx, self._sdx, self._sy, self._sdy,
+         px, py, self._settled) = _cursor_step(
+            rx, ry,
+            self._sx, self._sdx, self._sy, self._sdy, dt, self._primed,
+            self.EDGE_MARGIN, self._INV_RANGE, self.ONE_EURO_MIN_CUTOFF,
+            self._beta_x, self._beta_y, self.ONE_EURO_D_CUTOFF,
+            self._screen_w, self._screen_h,
+        )
+        self._primed = True
+        self._raw_x = rx
+        self._raw_y = ry
+        self._track_px = px, py
+        return self._track_px
 
-    def handle_cursor(self, event: dict):
+    def handle_cursor(self, event: dict, move: bool = True):
         """
         Move the OS mouse cursor to track the hand position.
         Called on EVERY frame (not just gesture events) for smooth tracking.
-        Uses pyautogui directly for zero-latency cursor movement.
-        Applies edge remapping + EMA smoothing for comfort.
+        Uses SetCursorPos directly for zero-latency cursor movement.
+        Applies edge remapping + One Euro smoothing for comfort.
 
         When a gesture is active (pinch in progress), the cursor is FROZEN
         at its pre-pinch position to prevent drift during the action.
+
+        move=False applies only the freeze bookkeeping — used for all but
+        the newest event of a coalesced burst, whose positions would be
+        overwritten before anyone saw them.
         """
-        # Check gesture state to decide whether to freeze/unfreeze
-        gesture = event.get("gesture", {})
+        if self._update_freeze(event) and move:
+            inflight = self._inflight
+            if inflight is not None:
+                if not inflight.done():
+                    return
+                self._inflight = None
+                self._last_px = -1      # the action moved the mouse
+            cursor = event.get("cursor")
+            if cursor:
+                self._move_to(cursor, event.get("timestamp"))
+
+    def _update_freeze(self, event: dict) -> bool:
+        """
+        Freeze state machine: enter-freeze / stay-frozen / exit-freeze.
+        Returns True when the cursor may follow this event.
+        """
+        gesture = event.get("gesture") or _EMPTY
         gstate = gesture.get("state", "")
         gtype = gesture.get("type", "none")
-
-        if gstate in ("start", "active") and gtype != "none":
-            # Gesture in progress — freeze cursor at current position
-            if not self._frozen:
-                self._frozen = True
-                # Capture current pixel position as the freeze point
-                cursor = event.get("cursor")
-                if cursor:
-                    cx = self._remap_edge(cursor.get("x", 0.5))
-                    cy = self._remap_edge(cursor.get("y", 0.5))
-                    cx, cy = self._smooth(cx, cy)
-                    self._freeze_px, self._freeze_py = self._norm_to_px(cx, cy)
-                else:
-                    # Fallback: use current mouse position
-                    pos = pyautogui.position()
-                    self._freeze_px, self._freeze_py = pos.x, pos.y
-                log.debug("Cursor FROZEN at (%d, %d)", self._freeze_px, self._freeze_py)
-            return  # Don't move cursor while frozen
-
-        if gstate in ("end", "ended", "") or gtype == "none":
-            if self._frozen:
-                self._frozen = False
-                log.debug("Cursor UNFROZEN")
-
-        cursor = event.get("cursor")
-        if not cursor:
+        active = gstate in _ACTIVE_STATES and gtype != "none"
+
+        if active and self._frozen:
+            return False  # Stay frozen — nothing else to do this frame
+
+        if active:
+            # Gesture just started — freeze cursor at current position
+            self._frozen = True
+            cursor = event.get("cursor")
+            if cursor:
+                self._freeze_px, self._freeze_py = self._track(cursor, event.get("timestamp"))
+            else:
+                # Fallback: use current mouse position
+                pos = pyautogui.position()
+                self._freeze_px, self._freeze_py = pos.x, pos.y
+            log.debug("Cursor FROZEN at (%d, %d)", self._freeze_px, self._freeze_py)
+            return False  # Don't move cursor while frozen
+
+        if self._frozen and (gstate in _END_STATES or gtype == "none"):
+            self._frozen = False
+            self._last_px = -1      # the action may have moved the mouse
+            log.debug("Cursor UNFROZEN")
+            # This event's action runs right after; a move racing it on the
+            # mover thread could land between its move and its click.
+            return False
+
+        return True
+
+    def _move_to(self, cursor: dict, ts_ns):
+        # Remap edges (reach all corners comfortably), smooth out jitter and
+        # convert to pixels in one kernel call; skip if it's the same pixel
+        px, py = self._track(cursor, ts_ns)
+        if px == self._last_px and py == self._last_py:
             return
+        self._last_px, self._last_py = px, py
 
-        # Raw normalised coords from the gesture client
-        cx = cursor.get("x", 0.5)
-        cy = cursor.get("y", 0.5)
-
-        # 1. Remap edges so you can reach all corners comfortably
-        cx = self._remap_edge(cx)
-        cy = self._remap_edge(cy)
-
-        # 2. Smooth to reduce jitter
-        cx, cy = self._smooth(cx, cy)
+        self._latest_px = (px, py)
+        self._wake.set()
 
-        # 3. Convert to pixels and move
-        px, py = self._norm_to_px(cx, cy)
-
-        try:
-            pyautogui.moveTo(px, py, duration=0, _pause=False)
-        except Exception:
-            pass  # Swallow errors to avoid breaking the event loop
-
-        # Rate-limited logging (once per second max)
-        now = time.monotonic()
-        if now - self._last_cursor_log > 1.0:
+        # Rate-limited logging — a wrapping move counter, no clock read
+        self._frame_ctr = (self._frame_ctr + 1) & 0xFF
+        if self._frame_ctr == 0 and log.isEnabledFor(logging.DEBUG):
             log.debug("Cursor → (%d, %d)", px, py)
-            self._last_cursor_log = now
 
-    def handle_event(self, event: dict) -> Optional[ToolResult]:
+    def _mover_loop(self):
+        _boost_thread_priority()
+        wake = self._wake
+        while True:
+            wake.wait()
+            wake.clear()
+            target = self._latest_px
+            if target is None:
+                continue
+            try:
+                _move_cursor(*target)
+            except Exception:
+                pass  # Swallow errors to keep the mover alive
+
+    def handle_event(self, event: dict) -> Optional[Future]:
         """
         Process a full gesture event envelope.
-        Returns the ToolResult if an action was executed, None if the event was skipped.
+        Returns a Future resolving to the action's ToolResult if one was
+        queued, None if the event was skipped.
         """
         gesture = event.get("gesture")
         if not gesture:
@@ -175,50 +347,61 @@ class GestureHandler:
         if gstate not in ("end", "ended"):
             return None
 
-        if gtype not in self.HANDLED_GESTURES:
-            return None
+        match gtype:
+            case "tap":
+                handler = self._handle_tap
+            case "double_tap":
+                handler = self._handle_double_tap
+            case "pinch_hold":
+                handler = self._handle_pinch_hold
+            case "pinch_drag":
+                handler = self._handle_pinch_drag
+            case "pinch_flick":
+                handler = self._handle_pinch_flick
+            case _:
+                return None
 
         # Extract data we need
-        interaction = gesture.get("interaction_data", {})
-        movement = interaction.get("movement", {})
-        cursor = event.get("cursor", {})
+        interaction = gesture.get("interaction_data") or _EMPTY
+        movement = interaction.get("movement") or _EMPTY
+        cursor = event.get("cursor") or _EMPTY
 
         # If we froze the cursor during the gesture, use the frozen pixel
         # position instead of the (possibly drifted) current position.
         if self._frozen or (self._freeze_px and self._freeze_py):
-            # Use frozen pixel coords — convert back to normalised for handlers
-            cx = self._freeze_px / self._screen_w
-            cy = self._freeze_py / self._screen_h
+            px = self._freeze_px
+            py = self._freeze_py
         else:
-            cx = cursor.get("x", gesture.get("tracking_data", {}).get("world_coordinates", {}).get("x", 0.5))
-            cy = cursor.get("y", gesture.get("tracking_data", {}).get("world_coordinates", {}).get("y", 0.5))
-
-        # Dispatch to the handler
-        handler_map = {
-            "tap": self._handle_tap,
-            "double_tap": self._handle_double_tap,
-            "pinch_hold": self._handle_pinch_hold,
-            "pinch_drag": self._handle_pinch_drag,
-            "pinch_flick": self._handle_pinch_flick,
-        }
-
-        handler = handler_map.get(gtype)
-        if handler is None:
-            return None
+            get = cursor.get
+            cx = get("x")
+            cy = get("y")
+            if cx is None or cy is None:
+                # Fall back to the gesture's world coordinates — only walked
+                # when the cursor block is missing a coordinate
+                tracking = gesture.get("tracking_data") or _EMPTY
+                world = tracking.get("world_coordinates") or _EMPTY
+                if cx is None:
+                    cx = world.get("x")
+                    if cx is None:
+                        cx = 0.5
+                if cy is None:
+                    cy = world.get("y")
+                    if cy is None:
+                        cy = 0.5
+            px = self._x_to_px(cx)
+            py = self._y_to_px(cy)
 
         self._action_count += 1
-        log.info(
-            "Gesture #%d: %s at (%.3f, %.3f)",
-            self._action_count, gtype, cx, cy,
-        )
+        log.info("Gesture #%d: %s at (%d, %d)", self._action_count, gtype, px, py)
 
-        result = handler(cx, cy, gesture, interaction, movement)
+        future = self._executor.submit(handler, px, py, gesture, interaction, movement)
+        self._inflight = future
 
         # Clear freeze point after action so next idle doesn't reuse stale coords
         self._freeze_px = 0
         self._freeze_py = 0
 
-        return result
+        return future
 
     def handle_speech(self, event: dict) -> Optional[str]:
         """
@@ -231,7 +414,7 @@ class GestureHandler:
 
         stype = speech.get("type", "")
         sstate = speech.get("state", "")
-        data = speech.get("data", {})
+        data = speech.get("data") or _EMPTY
 
         if stype == "transcript" and sstate == "final":
             text = data.get("text", "")
@@ -247,11 +430,23 @@ class GestureHandler:
 
     # ── Private handlers ─────────────────────────────────────────────────
 
-    def _norm_to_px(self, nx: float, ny: float) -> tuple[int, int]:
-        """Convert normalised (0-1) coordinates to screen pixels."""
-        px = int(max(0.0, min(1.0, nx)) * self._screen_w)
-        py = int(max(0.0, min(1.0, ny)) * self._screen_h)
-        return px, py
+    # Normalised (0-1) → screen pixel, one axis at a time (no tuple to
+    # build and unpack per call)
+    def _x_to_px(self, nx: float) -> int:
+        w = self._screen_w
+        return int(nx * w) if 0.0 <= nx <= 1.0 else (0 if nx < 0.0 else w)
+
+    def _y_to_px(self, ny: float) -> int:
+        h = self._screen_h
+        return int(ny * h) if 0.0 <= ny <= 1.0 else (0 if ny < 0.0 else h)
+
+    def _bind_tool(self, tool_name: str):
+        """
+        The execute method of the tool set providing tool_name, or
+        _execute_tool (which reports it unavailable) if none does.
+        """
+        tool_set = self._tools.get(tool_name)
+        return tool_set.execute if tool_set else self._execute_tool
 
     def _execute_tool(self, tool_name: str, **kwargs) -> ToolResult:
         """Execute a tool on the shared layer instances."""
@@ -264,60 +459,59 @@ class GestureHandler:
             )
         return tool_set.execute(tool_name, **kwargs)
 
-    def _handle_tap(self, cx, cy, gesture, interaction, movement) -> ToolResult:
+    def _handle_tap(self, px, py, gesture, interaction, movement) -> ToolResult:
         """Single left-click at cursor position."""
-        px, py = self._norm_to_px(cx, cy)
         log.info("  → click(%d, %d)", px, py)
-        return self._execute_tool("click", x=px, y=py, button="left", clicks=1)
+        return self._exec_click("click", x=px, y=py, button="left", clicks=1)
 
-    def _handle_double_tap(self, cx, cy, gesture, interaction, movement) -> ToolResult:
+    def _handle_double_tap(self, px, py, gesture, interaction, movement) -> ToolResult:
         """Double left-click at cursor position."""
-        px, py = self._norm_to_px(cx, cy)
         log.info("  → click(%d, %d, clicks=2)", px, py)
-        return self._execute_tool("click", x=px, y=py, button="left", clicks=2)
+        return self._exec_click("click", x=px, y=py, button="left", clicks=2)
 
-    def _handle_pinch_hold(self, cx, cy, gesture, interaction, movement) -> ToolResult:
+    def _handle_pinch_hold(self, px, py, gesture, interaction, movement) -> ToolResult:
         """Right-click (context menu) at cursor position."""
-        px, py = self._norm_to_px(cx, cy)
         log.info("  → click(%d, %d, button=right)", px, py)
-        return self._execute_tool("click", x=px, y=py, button="right", clicks=1)
+        return self._exec_click("click", x=px, y=py, button="right", clicks=1)
 
-    def _handle_pinch_drag(self, cx, cy, gesture, interaction, movement) -> ToolResult:
-        """Drag from origin to current position."""
-        origin = movement.get("origin", {})
-        current = movement.get("current", {})
+    def _handle_pinch_drag(self, px, py, gesture, interaction, movement) -> ToolResult:
+        """Drag from origin to current position (missing ends use the cursor pixel)."""
+        origin = movement.get("origin") or _EMPTY
+        current = movement.get("current") or _EMPTY
 
-        ox, oy = origin.get("x", cx), origin.get("y", cy)
-        dx, dy = current.get("x", cx), current.get("y", cy)
+        ox, oy = origin.get("x"), origin.get("y")
+        dx, dy = current.get("x"), current.get("y")
 
-        from_x, from_y = self._norm_to_px(ox, oy)
-        to_x, to_y = self._norm_to_px(dx, dy)
+        from_x = px if ox is None else self._x_to_px(ox)
+        from_y = py if oy is None else self._y_to_px(oy)
+        to_x = px if dx is None else self._x_to_px(dx)
+        to_y = py if dy is None else self._y_to_px(dy)
 
         log.info("  → drag_and_drop(%d,%d → %d,%d)", from_x, from_y, to_x, to_y)
-        return self._execute_tool(
+        return self._exec_drag_and_drop(
             "drag_and_drop",
             from_x=from_x, from_y=from_y,
             to_x=to_x, to_y=to_y,
             duration=0.5,
         )
 
-    def _handle_pinch_flick(self, cx, cy, gesture, interaction, movement) -> ToolResult:
+    def _handle_pinch_flick(self, px, py, gesture, interaction, movement) -> ToolResult:
         """Scroll based on flick velocity vector."""
-        velocity = movement.get("velocity", {})
+        velocity = movement.get("velocity") or _EMPTY
         vx = velocity.get("vx", 0.0)
         vy = velocity.get("vy", 0.0)
 
         # Determine primary scroll direction from velocity
-        if abs(vy) >= abs(vx):
+        avx, avy = abs(vx), abs(vy)
+        if avy >= avx:
             direction = "down" if vy > 0 else "up"
-            magnitude = abs(vy)
+            magnitude = avy
         else:
             direction = "right" if vx > 0 else "left"
-            magnitude = abs(vx)
+            magnitude = avx
 
-        # Scale velocity to scroll amount (1-10 clicks)
-        amount = max(1, min(10, int(magnitude / 200)))
+        # Scale velocity to scroll amount (1-10 clicks, one per 200 px/s)
+        amount = 1 if magnitude < 200 else 10 if magnitude >= 2000 else int(magnitude * 0.005)
 
-        px, py = self._norm_to_px(cx, cy)
         log.info("  → scroll(%d, %d, %s, %d)", px, py, direction, amount)
-        return self._execute_tool("scroll", x=px, y=py, direction=direction, amount=amount)
+        return self._exec_scroll("scroll", x=px, y=py, direction=direction, amount=amount)
@@ -9,7 +9,7 @@ import json
 import ctypes
 from typing import Optional
 from tools.base import BaseTool, ToolDefinition, ToolResult, ToolResultStatus, LayerType
-from utils.screenshot import capture_screenshot, screenshot_to_base64
+from utils.screenshot import capture_screenshot, screenshot_to_base64, last_capture_backend
 
 try:
     import pyautogui
@@ -26,11 +26,79 @@ try:
 except ImportError:
     HAS_COMTYPES = False
 
+try:
+    import win32clipboard
+    HAS_WIN32CLIPBOARD = True
+except ImportError:
+    HAS_WIN32CLIPBOARD = False
+
 
 # UIAutomation COM interface IDs
 IID_IUIAutomation = comtypes.GUID("{30CBE57D-D9D0-452A-AB13-7AC5AC4825EE}")
 CLSID_CUIAutomation = comtypes.GUID("{FF48DBA4-60EF-4201-AA87-54103EEF594E}")
 
+# UIAutomation property and scope IDs (UIAutomationClient.h)
+UIA_BoundingRectanglePropertyId = 30001
+UIA_ControlTypePropertyId = 30003
+UIA_NamePropertyId = 30005
+UIA_IsOffscreenPropertyId = 30022
+TreeScope_Element = 1
+TreeScope_Descendants = 4
+
+# Interactive control types we care about
+INTERACTIVE_TYPES = frozenset({
+    50000,  # Button
+    50002,  # CheckBox
+    50003,  # ComboBox
+    50004,  # Edit
+    50005,  # Hyperlink
+    50007,  # List
+    50009,  # MenuItem
+    50020,  # TabItem
+    50025,  # TreeItem
+    50030,  # RadioButton
+})
+
+# A snapshot's element list is reused for this long (seconds) while the
+# foreground window and focused element are unchanged and this layer hasn't
+# run any other tool in between (input, or a wait for the UI to settle)
+SNAPSHOT_CACHE_TTL = 2.0
+_READ_ONLY_TOOLS = frozenset({"snapshot"})
+
+# Snapshot text is cut off (with a marker saying which refs were trimmed)
+# once it reaches this many characters; start_ref/end_ref fetch the rest
+SNAPSHOT_MAX_CHARS = 50_000
+
+# The desktop tree walk doesn't descend into elements smaller than this
+# (px²) or offscreen: nothing under them can be usefully clicked.  The
+# elements themselves are still considered.
+MIN_DESCEND_AREA = 20 * 20
+
+
+def _get_clipboard_text() -> Optional[str]:
+    """Current clipboard text, or None if the clipboard holds no text."""
+    if not HAS_WIN32CLIPBOARD:
+        raise RuntimeError("pywin32 is not installed")
+    win32clipboard.OpenClipboard()
+    try:
+        if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
+            return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+        return None
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+def _set_clipboard_text(text: str):
+    """Replace the clipboard contents with text."""
+    if not HAS_WIN32CLIPBOARD:
+        raise RuntimeError("pywin32 is not installed")
+    win32clipboard.OpenClipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
 
 class UIAutomationHelper:
     """
@@ -40,6 +108,9 @@ class UIAutomationHelper:
 
     def __init__(self):
         self._automation = None
+        self._cache_request = None
+        self._interactive_condition = None
+        self._control_walker = None
         self._initialize()
 
     def _initialize(self):
@@ -59,6 +130,28 @@ class UIAutomationHelper:
             except Exception as e:
                 raise RuntimeError(f"Failed to initialize UIAutomation: {e}")
 
+        # Every element fetched with this request arrives with the properties
+        # the tree walk reads already marshaled, so reading them is local
+        # (Cached*) instead of one cross-process COM call each (Current*).
+        cache_request = self._automation.CreateCacheRequest()
+        for prop_id in (UIA_NamePropertyId, UIA_ControlTypePropertyId,
+                        UIA_BoundingRectanglePropertyId, UIA_IsOffscreenPropertyId):
+            cache_request.AddProperty(prop_id)
+        cache_request.TreeScope = TreeScope_Element
+        self._cache_request = cache_request
+
+        # "ControlType is one of INTERACTIVE_TYPES and it's on screen",
+        # evaluated by the UIA provider so non-matching nodes never cross COM
+        condition = None
+        for type_id in sorted(INTERACTIVE_TYPES):
+            type_cond = self._automation.CreatePropertyCondition(UIA_ControlTypePropertyId, type_id)
+            condition = type_cond if condition is None else self._automation.CreateOrCondition(condition, type_cond)
+        onscreen = self._automation.CreatePropertyCondition(UIA_IsOffscreenPropertyId, False)
+        self._interactive_condition = self._automation.CreateAndCondition(condition, onscreen)
+
+        # Fetched once; reading it is a COM property get
+        self._control_walker = self._automation.ControlViewWalker
+
     def get_focused_window(self) -> dict:
         """Get information about the currently focused window."""
         try:
@@ -71,74 +164,96 @@ class UIAutomationHelper:
         except Exception:
             return {"name": "Unknown", "control_type": 0, "class_name": ""}
 
-    def get_interactive_elements(self, max_depth: int = 10, max_elements: int = 500) -> list[dict]:
+    def get_interactive_elements(self, max_depth: int = 10, max_elements: int = 500,
+                                 hwnd: Optional[int] = None) -> list[dict]:
         """
-        Walk the UI tree and collect interactive elements (buttons, links, text fields, etc.)
+        Collect interactive elements (buttons, links, text fields, etc.)
         Returns a list of elements with their names, types, and bounding rectangles.
+
+        With hwnd, a single FindAll over that window's descendants does the
+        control-type filtering inside the UIA provider.  Without one (or if
+        the provider rejects the query), walk the desktop tree instead.
         """
         elements = []
+        if hwnd:
+            try:
+                window = self._automation.ElementFromHandleBuildCache(hwnd, self._cache_request)
+                found = window.FindAllBuildCache(
+                    TreeScope_Descendants, self._interactive_condition, self._cache_request
+                )
+                for i in range(found.Length):
+                    if len(elements) >= max_elements:
+                        break
+                    self._add_element(found.GetElement(i), elements)
+                return elements
+            except Exception:
+                elements = []
         try:
-            root = self._automation.GetRootElement()
-            self._walk_tree(root, elements, 0, max_depth, max_elements)
+            root = self._automation.GetRootElement().BuildUpdatedCache(self._cache_request)
+            self._walk_tree(root, elements, max_depth, max_elements)
         except Exception as e:
             pass
         return elements
 
-    def _walk_tree(self, element, elements: list, depth: int, max_depth: int, max_elements: int):
-        """Recursively walk the UI tree."""
-        if depth > max_depth or len(elements) >= max_elements:
-            return
-
+    def _add_element(self, element, elements: list):
+        """Append element's info if it's a named, visible interactive control."""
         try:
-            # Interactive control types we care about
-            INTERACTIVE_TYPES = {
-                50000,  # Button
-                50002,  # CheckBox
-                50003,  # ComboBox
-                50004,  # Edit
-                50005,  # Hyperlink
-                50007,  # List
-                50009,  # MenuItem
-                50020,  # TabItem
-                50025,  # TreeItem
-                50030,  # RadioButton
-            }
-
-            control_type = element.CurrentControlType
-            name = element.CurrentName or ""
-            is_interactive = control_type in INTERACTIVE_TYPES
-
-            if is_interactive and name:
-                try:
-                    rect = element.CurrentBoundingRectangle
-                    if rect.right > rect.left and rect.bottom > rect.top:
-                        cx = (rect.left + rect.right) // 2
-                        cy = (rect.top + rect.bottom) // 2
-                        elements.append({
-                            "name": name,
-                            "type": self._get_control_type_name(control_type),
-                            "x": cx,
-                            "y": cy,
-                            "rect": {
-                                "left": rect.left, "top": rect.top,
-                                "right": rect.right, "bottom": rect.bottom
-                            }
-                        })
-                except Exception:
-                    pass
+            control_type = element.CachedControlType
+            name = element.CachedName or ""
+            if control_type not in INTERACTIVE_TYPES or not name or element.CachedIsOffscreen:
+                return
+            # Not offscreen can still mean a zero-area rect (collapsed items)
+            rect = element.CachedBoundingRectangle
+            if rect.right > rect.left and rect.bottom > rect.top:
+                cx = (rect.left + rect.right) // 2
+                cy = (rect.top + rect.bottom) // 2
+                elements.append({
+                    "name": name,
+                    "type": self._get_control_type_name(control_type),
+                    "x": cx,
+                    "y": cy,
+                    "rect": {
+                        "left": rect.left, "top": rect.top,
+                        "right": rect.right, "bottom": rect.bottom
+                    }
+                })
+        except Exception:
+            pass
 
-            # Walk children
+    def _walk_tree(self, root, elements: list, max_depth: int, max_elements: int):
+        """Walk the UI tree depth-first (pre-order) from root, to max_depth."""
+        first_child = self._control_walker.GetFirstChildElementBuildCache
+        next_sibling = self._control_walker.GetNextSiblingElementBuildCache
+        cache_request = self._cache_request
+        add = self._add_element
+
+        stack = [(root, 0)]
+        pop, push = stack.pop, stack.append
+        while stack and len(elements) < max_elements:
+            element, depth = pop()
+            add(element, elements)
+            if depth == max_depth:
+                continue
             try:
-                walker = self._automation.ControlViewWalker
-                child = walker.GetFirstChildElement(element)
-                while child is not None and len(elements) < max_elements:
-                    self._walk_tree(child, elements, depth + 1, max_depth, max_elements)
-                    child = walker.GetNextSiblingElement(child)
+                if element.CachedIsOffscreen:
+                    continue
+                rect = element.CachedBoundingRectangle
+                if (rect.right - rect.left) * (rect.bottom - rect.top) < MIN_DESCEND_AREA:
+                    continue
             except Exception:
                 pass
 
-        except Exception:
-            pass
+            # Children go on the stack last-first so they're visited in order
+            children = []
+            try:
+                child = first_child(element, cache_request)
+                while child is not None:
+                    children.append(child)
+                    child = next_sibling(child, cache_request)
+            except Exception:
+                pass
+            for child in reversed(children):
+                push((child, depth + 1))
 
     @staticmethod
     def _get_control_type_name(type_id: int) -> str:
@@ -168,6 +283,8 @@ class UIAutomationLayer(BaseTool):
             raise RuntimeError("pyautogui not installed. Run: pip install pyautogui")
 
         self._ui_helper: Optional[UIAutomationHelper] = None
+        # (key, monotonic time, elements) of the last snapshot's tree walk
+        self._snapshot_cache: Optional[tuple[tuple, float, list[dict]]] = None
 
         self._definitions = [
             ToolDefinition(
@@ -176,6 +293,8 @@ class UIAutomationLayer(BaseTool):
                     "Capture the current desktop state: focused window, open windows, "
                     "and interactive elements (buttons, text fields, links) with their "
                     "screen coordinates. Set use_vision=true to also include a screenshot. "
+                    "Set use_ui_tree=false (with use_vision=true) for a fast screenshot-only "
+                    "snapshot when you don't need element coordinates. "
                     "ALWAYS call this first to understand what's on screen before clicking."
                 ),
                 parameters={
@@ -185,6 +304,19 @@ class UIAutomationLayer(BaseTool):
                             "type": "boolean",
                             "description": "Also capture a screenshot for visual analysis.",
                             "default": False
+                        },
+                        "use_ui_tree": {
+                            "type": "boolean",
+                            "description": "Collect the focused element and interactive elements from the UI tree (the slow part of a snapshot).",
+                            "default": True
+                        },
+                        "start_ref": {
+                            "type": "integer",
+                            "description": "First element ref to list (e.g. to continue after a '[refs N-M trimmed]' marker)."
+                        },
+                        "end_ref": {
+                            "type": "integer",
+                            "description": "Last element ref to list (inclusive)."
                         }
                     }
                 },
@@ -355,6 +487,13 @@ class UIAutomationLayer(BaseTool):
             ),
         ]
 
+    def execute(self, tool_name: str, **kwargs) -> ToolResult:
+        # Any input this layer sends — or a wait for a page load/animation —
+        # may change the UI under the cached snapshot
+        if tool_name not in _READ_ONLY_TOOLS:
+            self._snapshot_cache = None
+        return super().execute(tool_name, **kwargs)
+
     def _ensure_ui_helper(self):
         """Lazy-initialize the UIAutomation helper."""
         if self._ui_helper is None:
@@ -363,22 +502,25 @@ class UIAutomationLayer(BaseTool):
             except Exception:
                 self._ui_helper = None
 
-    def _execute_snapshot(self, use_vision: bool = False) -> ToolResult:
+    def _execute_snapshot(self, use_vision: bool = False, use_ui_tree: bool = True,
+                          start_ref: Optional[int] = None, end_ref: Optional[int] = None) -> ToolResult:
         """Capture desktop state: focused window + interactive elements."""
-        self._ensure_ui_helper()
+        if use_ui_tree:
+            self._ensure_ui_helper()
 
         # Get screen size
         screen_w, screen_h = pyautogui.size()
 
         # Get focused window info
         focused_info = {"name": "Unknown"}
-        if self._ui_helper:
+        if use_ui_tree and self._ui_helper:
             try:
                 focused_info = self._ui_helper.get_focused_window()
             except Exception:
                 pass
 
         # Get foreground window via win32
+        hwnd = None
         try:
             import win32gui
             hwnd = win32gui.GetForegroundWindow()
@@ -388,13 +530,20 @@ class UIAutomationLayer(BaseTool):
             fg_title = focused_info.get("name", "Unknown")
             fg_rect = (0, 0, screen_w, screen_h)
 
-        # Get interactive elements
+        # Get interactive elements (reusing the last walk if nothing changed)
         elements = []
-        if self._ui_helper:
-            try:
-                elements = self._ui_helper.get_interactive_elements()
-            except Exception:
-                pass
+        if use_ui_tree:
+            cache_key = (hwnd, fg_title, tuple(fg_rect), tuple(focused_info.values()))
+            cached = self._snapshot_cache
+            now = time.monotonic()
+            if cached is not None and cached[0] == cache_key and now - cached[1] < SNAPSHOT_CACHE_TTL:
+                elements = cached[2]
+            elif self._ui_helper:
+                try:
+                    elements = self._ui_helper.get_interactive_elements(hwnd=hwnd)
+                    self._snapshot_cache = (cache_key, now, elements)
+                except Exception:
+                    pass
 
         # Build snapshot output
         parts = [
@@ -403,20 +552,35 @@ class UIAutomationLayer(BaseTool):
             f"Focused Window: {fg_title}",
             f"Window Position: left={fg_rect[0]}, top={fg_rect[1]}, right={fg_rect[2]}, bottom={fg_rect[3]}",
             f"",
-            f"Interactive Elements ({len(elements)}):",
+            f"Interactive Elements ({len(elements)}):" if use_ui_tree
+            else "Interactive Elements: UI tree skipped (use_ui_tree=False)",
         ]
 
-        for i, el in enumerate(elements):
-            parts.append(
-                f"  [{i}] {el['type']}: \"{el['name']}\" at ({el['x']}, {el['y']})"
-            )
+        # List refs first..last, stopping once the text hits the size cap.
+        # Refs are indices into the full element list, so they stay valid
+        # across sliced/trimmed calls on the same (cached) snapshot.
+        first = 0 if start_ref is None else max(0, start_ref)
+        last = len(elements) - 1 if end_ref is None else min(end_ref, len(elements) - 1)
+        size = sum(map(len, parts))
+        shown_end = last + 1
+        for i in range(first, last + 1):
+            el = elements[i]
+            line = f"  [{i}] {el['type']}: \"{el['name']}\" at ({el['x']}, {el['y']})"
+            size += len(line) + 1
+            if size > SNAPSHOT_MAX_CHARS:
+                parts.append(f"  [refs {i}-{last} trimmed — call snapshot with start_ref={i} for more]")
+                shown_end = i
+                break
+            parts.append(line)
 
         output = "\n".join(parts)
         data = {
             "screen": {"width": screen_w, "height": screen_h},
             "focused_window": fg_title,
-            "elements": elements,
+            "elements": elements[first:shown_end],
         }
+        if first or shown_end < len(elements):
+            data["first_ref"] = first
 
         # Optionally include screenshot
         screenshot_b64 = None
@@ -424,6 +588,7 @@ class UIAutomationLayer(BaseTool):
             try:
                 img, _ = capture_screenshot()
                 screenshot_b64 = screenshot_to_base64(img)
+                data["screenshot_backend"] = last_capture_backend()
             except Exception:
                 pass
 
@@ -456,8 +621,6 @@ class UIAutomationLayer(BaseTool):
     def _execute_type_text(self, x: int, y: int, text: str, clear: bool = False, press_enter: bool = False) -> ToolResult:
         """Click on a text field and type text using clipboard paste for reliability."""
         try:
-            import subprocess
-
             # Click to focus the field
             pyautogui.click(x=x, y=y)
             time.sleep(0.3)  # Longer delay for focus
@@ -476,20 +639,13 @@ class UIAutomationLayer(BaseTool):
             # Use clipboard-based typing for reliability
             # Save current clipboard content
             try:
-                old_clipboard = subprocess.run(
-                    ["powershell", "-command", "Get-Clipboard"],
-                    capture_output=True, text=True, timeout=3
-                ).stdout.strip()
+                old_clipboard = _get_clipboard_text()
             except Exception:
                 old_clipboard = None
 
             # Copy our text to clipboard
             try:
-                subprocess.run(
-                    ["powershell", "-command", f"Set-Clipboard -Value '{text.replace(chr(39), chr(39)+chr(39))}'"],
-                    capture_output=True, timeout=3
-                )
-                time.sleep(0.1)
+                _set_clipboard_text(text)
 
                 # Paste using Ctrl+V
                 pyautogui.hotkey("ctrl", "v")
@@ -504,10 +660,7 @@ class UIAutomationLayer(BaseTool):
             # Restore original clipboard
             if old_clipboard is not None:
                 try:
-                    subprocess.run(
-                        ["powershell", "-command", f"Set-Clipboard -Value '{old_clipboard.replace(chr(39), chr(39)+chr(39))}'"],
-                        capture_output=True, timeout=3
-                    )
+                    _set_clipboard_text(old_clipboard)
                 except Exception:
                     pass
 
@@ -18,7 +18,7 @@ from prompt_toolkit.history import FileHistory
 
 from tools.base import BaseTool
 from gesture_handler import GestureHandler
-from ws_client import GestureWSClient
+from ws_client import GestureWSClient, decode_event
 from orchestrator.agent import Agent
 from config import GESTURE_WS_URL, SPEECH_WS_URL
 import tts
@@ -76,25 +76,47 @@ class ExecutionMode:
             await self._client.run(
                 on_gesture=self._on_gesture,
                 on_speech=self._on_speech,
+                on_gesture_batch=self._on_gesture_batch,
             )
         except asyncio.CancelledError:
             pass
         finally:
             await self._client.stop()
 
-    def _on_gesture(self, event: dict):
+    def _on_gesture(self, event: dict, move_cursor: bool = True):
         """Callback for gesture events from the WebSocket."""
         # Always track cursor position (moves the OS mouse to follow the hand)
-        self._handler.handle_cursor(event)
-
-        # Then check for gesture actions (tap, drag, etc.)
-        result = self._handler.handle_event(event)
-        if result is not None:
-            gtype = event.get("gesture", {}).get("type", "?")
-            if result.status.value == "error":
-                console.print(f"  [red]✗ {gtype}:[/red] {result.error}")
-            else:
-                console.print(f"  [green]✓ {gtype}:[/green] {result.output[:120]}")
+        self._handler.handle_cursor(event, move=move_cursor)
+
+        # Then check for gesture actions (tap, drag, etc.) — these run on
+        # the handler's worker thread; report each one when it finishes
+        future = self._handler.handle_event(event)
+        if future is not None:
+            gtype = event.get("gesture").get("type", "?")   # present: an action ran
+            future.add_done_callback(lambda f: self._report_action(gtype, f))
+
+    @staticmethod
+    def _report_action(gtype: str, future):
+        """Print the outcome of a finished gesture action."""
+        error = future.exception()
+        if error is not None:
+            console.print(f"  [red]✗ {gtype}:[/red] {error}")
+            return
+        result = future.result()
+        if result.status.value == "error":
+            console.print(f"  [red]✗ {gtype}:[/red] {result.error}")
+        else:
+            console.print(f"  [green]✓ {gtype}:[/green] {result.output[:120]}")
+
+    def _on_gesture_batch(self, events: list[dict]):
+        """
+        Callback for a coalesced burst of gesture events.  Every event still
+        goes through freeze tracking and action dispatch in order; only the
+        newest one moves the cursor.
+        """
+        last = len(events) - 1
+        for i, event in enumerate(events):
+            self._on_gesture(event, move_cursor=(i == last))
 
     def _on_speech(self, event: dict):
         """Callback for speech events (transcript display only for now)."""
@@ -235,7 +257,6 @@ class AutoPilotMode:
 
     async def _speech_loop(self):
         """Async loop listening for speech transcripts on the WebSocket."""
-        import json
         import websockets
 
         while True:
@@ -253,38 +274,38 @@ class AutoPilotMode:
 
                     async for raw in ws:
                         try:
-                            if isinstance(raw, bytes):
-                                event = json.loads(raw.decode("utf-8"))
-                            else:
-                                event = json.loads(raw)
-                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            event = decode_event(raw)
+                        except ValueError:
                             continue
 
-                        # Extract final transcripts
-                        speech = event.get("speech", {})
-                        if speech.get("type") != "transcript" or speech.get("state") != "final":
-                            # Show listening/speaking status
-                            if speech.get("type") == "status":
-                                state = speech.get("state", "")
-                                if state == "speaking":
-                                    console.print("[dim yellow]🎙  Listening to you…[/dim yellow]")
-                            continue
-
-                        text = speech.get("data", {}).get("text", "").strip()
-                        if not text:
-                            continue
-
-                        confidence = speech.get("data", {}).get("confidence", 0.0)
-                        console.print(
-                            f"\n[bold blue]🎤 You said:[/bold blue] \"{text}\" "
-                            f"[dim](conf={confidence:.2f})[/dim]"
-                        )
-
-                        # Execute in a thread so the WS stays alive
-                        loop = asyncio.get_event_loop()
-                        await loop.run_in_executor(None, self._execute_task, text)
-
-                        console.print("\n[bold green]🎤 Listening for next command…[/bold green]")
+                        # The server coalesces bursts into a JSON array frame;
+                        # handle every event in it, in order
+                        for event in (event if isinstance(event, list) else (event,)):
+                            # Extract final transcripts
+                            speech = event.get("speech", {})
+                            if speech.get("type") != "transcript" or speech.get("state") != "final":
+                                # Show listening/speaking status
+                                if speech.get("type") == "status":
+                                    state = speech.get("state", "")
+                                    if state == "speaking":
+                                        console.print("[dim yellow]🎙  Listening to you…[/dim yellow]")
+                                continue
+
+                            text = speech.get("data", {}).get("text", "").strip()
+                            if not text:
+                                continue
+
+                            confidence = speech.get("data", {}).get("confidence", 0.0)
+                            console.print(
+                                f"\n[bold blue]🎤 You said:[/bold blue] \"{text}\" "
+                                f"[dim](conf={confidence:.2f})[/dim]"
+                            )
+
+                            # Execute in a thread so the WS stays alive
+                            loop = asyncio.get_event_loop()
+                            await loop.run_in_executor(None, self._execute_task, text)
+
+                            console.print("\n[bold green]🎤 Listening for next command…[/bold green]")
 
             except websockets.exceptions.ConnectionClosed:
                 console.print("[yellow]Speech connection lost. Reconnecting…[/yellow]")
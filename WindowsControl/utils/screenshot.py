@@ -1,5 +1,5 @@
 """
-Utility: Fast screenshot capture using mss + PIL.
+Utility: Fast screenshot capture using DXCam / mss + PIL.
 Captures the screen and optionally resizes for sending to vision models.
 """
 
@@ -13,8 +13,55 @@ try:
 except ImportError:
     HAS_MSS = False
 
+try:
+    import dxcam  # optional: DXGI Desktop Duplication capture (Windows 8+)
+    HAS_DXCAM = True
+except ImportError:
+    HAS_DXCAM = False
+
 from config import SCREENSHOT_MAX_WIDTH, SCREENSHOT_MAX_HEIGHT
 
+_dxcam_camera = None         # primary-output camera, created on first use
+_dxcam_failed = False        # creation failed (e.g. RDP session) — don't retry
+_last_backend = ""
+
+
+def last_capture_backend() -> str:
+    """Which backend took the most recent screenshot: "dxcam", "mss" or "pillow"."""
+    return _last_backend
+
+
+def _grab_dxcam(region: tuple | None) -> Image.Image | None:
+    """
+    Grab the primary output via DXGI Desktop Duplication.  Returns None
+    when DXCam can't serve the request — it has no new frame since the last
+    grab, or the region lies outside the primary output — so the caller
+    falls back to mss.
+    """
+    global _dxcam_camera, _dxcam_failed
+    if _dxcam_camera is None:
+        if _dxcam_failed:
+            return None
+        try:
+            _dxcam_camera = dxcam.create(output_idx=0, output_color="RGB")
+        except Exception:
+            _dxcam_failed = True
+            return None
+        if _dxcam_camera is None:
+            _dxcam_failed = True
+            return None
+    try:
+        if region:
+            left, top, w, h = region
+            frame = _dxcam_camera.grab(region=(left, top, left + w, top + h))
+        else:
+            frame = _dxcam_camera.grab()
+    except Exception:
+        return None
+    if frame is None:
+        return None
+    return Image.fromarray(frame)
+
 
 def capture_screenshot(
     monitor: int = 0,
@@ -34,7 +81,11 @@ def capture_screenshot(
     Returns:
         (PIL Image, scale_factor) where scale_factor maps LLM coords back to real screen
     """
-    if HAS_MSS:
+    global _last_backend
+    img = _grab_dxcam(region) if HAS_DXCAM and monitor == 0 else None
+    if img is not None:
+        _last_backend = "dxcam"
+    elif HAS_MSS:
         with mss.mss() as sct:
             if region:
                 monitor_def = {
@@ -49,6 +100,7 @@ def capture_screenshot(
 
             raw = sct.grab(monitor_def)
             img = Image.frombytes("RGB", raw.size, raw.rgb)
+        _last_backend = "mss"
     else:
         # Fallback to PIL.ImageGrab
         from PIL import ImageGrab
@@ -57,6 +109,7 @@ def capture_screenshot(
             img = ImageGrab.grab(bbox=(left, top, left + w, top + h))
         else:
             img = ImageGrab.grab()
+        _last_backend = "pillow"
 
     # Calculate scale factor
     orig_w, orig_h = img.size
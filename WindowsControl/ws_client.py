@@ -8,18 +8,118 @@ import json
 import logging
 from typing import Optional, Callable
 
+try:
+    import msgpack
+except ImportError:  # optional: only needed if a producer sends msgpack events
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:  # optional: typed gesture decoding; plain dicts without it
+    msgspec = None
+
 log = logging.getLogger("ws_client")
 
 
+def decode_event(message):
+    """
+    Decode one server frame into an event dict (or a list of them).
+    JSON by default; binary frames that aren't JSON are msgpack maps.
+    Raises ValueError on undecodable input.
+    """
+    if isinstance(message, bytes):
+        if message[:1] not in (b"{", b"[") and msgpack is not None:
+            try:
+                return msgpack.unpackb(message, raw=False)
+            except Exception as e:
+                raise ValueError(f"bad msgpack frame: {e}") from e
+        message = message.decode("utf-8")
+    return json.loads(message)
+
+
+# ── Typed gesture events ─────────────────────────────────────────────────
+# With msgspec, gesture frames decode straight into these Structs in one C
+# pass (JSON or msgpack) instead of json.loads building nested dicts.  Only
+# the fields GestureHandler reads are declared; everything else in the
+# envelope is skipped by the decoder.  Nested objects default to None, the
+# same as a missing key, and every Struct keeps a dict-style .get() so the
+# handlers accept either form.
+if msgspec is not None:
+    class _Record(msgspec.Struct, gc=False):
+        def get(self, key, default=None):
+            return getattr(self, key, default)
+
+    class Point(_Record):
+        x: Optional[float] = None
+        y: Optional[float] = None
+
+    class Velocity(_Record):
+        vx: float = 0.0
+        vy: float = 0.0
+
+    class Movement(_Record):
+        origin: Optional[Point] = None
+        current: Optional[Point] = None
+        velocity: Optional[Velocity] = None
+
+    class Interaction(_Record):
+        movement: Optional[Movement] = None
+
+    class Tracking(_Record):
+        world_coordinates: Optional[Point] = None
+
+    class Gesture(_Record):
+        type: str = "none"
+        state: str = ""
+        tracking_data: Optional[Tracking] = None
+        interaction_data: Optional[Interaction] = None
+
+    class GestureEvent(_Record):
+        timestamp: Optional[int | float | str] = None
+        gesture: Optional[Gesture] = None
+        cursor: Optional[Point] = None
+
+    _GestureFrame = GestureEvent | list[GestureEvent]
+    _gesture_json = msgspec.json.Decoder(_GestureFrame)
+    _gesture_msgpack = msgspec.msgpack.Decoder(_GestureFrame)
+
+    def decode_gesture_event(message):
+        """
+        Decode one gesture frame into a GestureEvent (or a list of them).
+        Raises ValueError on undecodable or mistyped input.
+        """
+        try:
+            if isinstance(message, str):
+                return _gesture_json.decode(message)
+            if message[:1] in (b"{", b"["):
+                return _gesture_json.decode(message)
+            return _gesture_msgpack.decode(message)
+        except msgspec.DecodeError as e:      # includes ValidationError
+            raise ValueError(str(e)) from e
+else:
+    decode_gesture_event = decode_event
+
+
 class GestureWSClient:
     """
     Async WebSocket consumer for the gesture + speech server.
     Connects to ws://host:port/ws/gestures and /ws/speech,
     parses incoming JSON events, and dispatches them to callbacks.
 
-    Usage:
+    Usage (as ExecutionMode wires it):
+        def on_gesture(event, move_cursor=True):
+            handler.handle_cursor(event, move=move_cursor)
+            future = handler.handle_event(event)    # action runs off-thread
+            if future is not None:
+                future.add_done_callback(report)    # receives the Future
+
+        def on_gesture_batch(events):               # coalesced burst
+            for i, event in enumerate(events):
+                on_gesture(event, move_cursor=(i == len(events) - 1))
+
         client = GestureWSClient(gesture_url, speech_url)
-        await client.run(on_gesture=handler.handle_event, on_speech=handler.handle_speech)
+        await client.run(on_gesture=on_gesture, on_gesture_batch=on_gesture_batch,
+                         on_speech=handler.handle_speech)
     """
 
     def __init__(
@@ -40,17 +140,23 @@ class GestureWSClient:
         self,
         on_gesture: Callable[[dict], None] = None,
         on_speech: Callable[[dict], None] = None,
+        on_gesture_batch: Callable[[list[dict]], None] = None,
     ):
         """
         Start listening on both WebSocket endpoints.
         Blocks until stop() is called or KeyboardInterrupt.
+
+        on_gesture_batch, if given, receives multi-event gesture frames
+        (bursts the server coalesced) as one list instead of one
+        on_gesture call per event.
         """
         self._running = True
 
         # Always start gesture listener
         self._tasks.append(
             asyncio.create_task(
-                self._listen_loop(self._gesture_url, "gesture", on_gesture)
+                self._listen_loop(self._gesture_url, "gesture", on_gesture, on_gesture_batch,
+                                  decode=decode_gesture_event)
             )
         )
 
@@ -85,6 +191,8 @@ class GestureWSClient:
         url: str,
         channel: str,
         callback: Optional[Callable[[dict], None]],
+        batch_callback: Optional[Callable[[list[dict]], None]] = None,
+        decode: Callable = decode_event,
     ):
         """
         Connect → listen → reconnect loop for a single WebSocket endpoint.
@@ -115,22 +223,29 @@ class GestureWSClient:
                         if not self._running:
                             break
 
-                        # Parse JSON
+                        # Parse JSON / msgpack
                         try:
-                            if isinstance(message, bytes):
-                                event = json.loads(message.decode("utf-8"))
-                            else:
-                                event = json.loads(message)
-                        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                            event = decode(message)
+                        except ValueError as e:
                             log.warning("[%s] Bad message: %s", channel, e)
                             continue
 
-                        # Dispatch to callback
-                        if callback:
+                        # The server coalesces bursts into a JSON array frame
+                        if isinstance(event, list) and batch_callback:
                             try:
-                                callback(event)
+                                batch_callback(event)
                             except Exception as e:
                                 log.error("[%s] Callback error: %s", channel, e)
+                            continue
+                        events = event if isinstance(event, list) else (event,)
+
+                        # Dispatch to callback
+                        if callback:
+                            for event in events:
+                                try:
+                                    callback(event)
+                                except Exception as e:
+                                    log.error("[%s] Callback error: %s", channel, e)
 
             except asyncio.CancelledError:
                 raise